@@ -12,33 +12,578 @@ from pydub import AudioSegment
 from pydub.exceptions import CouldntEncodeError
 import subprocess
 import threading
+import concurrent.futures
 import queue
+import collections
+import functools
+import hashlib
+import importlib.util
+import itertools
+import mmap
+import pickle
+import shutil
 import time
+import tempfile
+import wave
 import traceback
 
 import librosa
 import numpy as np
 
+try:
+    import orjson # Optional: much faster JSONL parsing/writing for large datasets
+    _json_loads = orjson.loads
+    def _json_dumps(obj): # -> UTF-8 bytes
+        try: return orjson.dumps(obj)
+        except TypeError: return json.dumps(obj).encode('utf-8') # orjson rejects undecodable names (surrogate escapes); json writes them as \udcxx
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    def _json_dumps(obj): return json.dumps(obj).encode('utf-8')
+    JSONDecodeError = json.JSONDecodeError
+
 # --- Configuration ---
 PATHS_FILENAME = 'paths.jsonl'
 SCORES_FILENAME = 'scores.jsonl'
+# Entry fields mirrored into float32 column arrays (NaN = missing) and bool column arrays
+NUMERIC_COLUMNS = ('CE', 'CU', 'PC', 'PQ', 'audio_length_seconds')
+FLAG_COLUMNS = ('starts_mid_word', 'ends_mid_word')
+STDERR_TAIL_LINES = 500 # Lines of audio-aes stderr kept for result/error messages
+SELECTION_CHUNK = 1000 # Treeview item ids per selection_set/selection_add call
+MAX_TREE_ROWS = 10000 # Rows inserted into the Treeview per page; 'Show More' adds another page
+MMAP_MIN_BYTES = 64 * 1024 * 1024 # JSONL files at least this large are memory-mapped instead of read whole
+SOUND_CACHE_SIZE = 8 # Decoded pygame Sound objects kept for instant replay (each holds the whole clip as PCM)
+FILTER_DEBOUNCE_MS = 150 # Typing pause before filter entries are re-applied
+LOG_FLUSH_MS = 100 # Log lines are buffered and inserted into the log widget at most this often
+# Preprocessing outcome codes per subdirectory (np.int8 array; the codes double as np.bincount slots)
+OUTCOME_NOT_REACHED, OUTCOME_OK, OUTCOME_ERROR, OUTCOME_SKIPPED_NO_WAV, OUTCOME_SKIPPED_EXISTING = -1, 0, 1, 2, 3
+FAILED_DIRS_SHOWN = 10 # Failed subdirectories named in the preprocessing summary
+LOG_MAX_LINES = 20000 # The log widget keeps only the newest lines (a huge Text widget slows every insert and redraw)
+# Parsed per-directory load results are cached here between runs (None disables the cache)
+LOAD_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'audiorev')
+LOAD_CACHE_VERSION = 1 # Bump when the cached layout changes
+# Generated numba filter kernels and their compiled machine code are kept here between runs (None: compile every run)
+KERNEL_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'audiorev', 'kernels')
+EXPORT_PREFETCH_MAX_BYTES = 16 * 1024 * 1024 # Larger WAVs aren't read ahead for export but streamed in blocks
+EXPORT_BLOCK_BYTES = 1024 * 1024 # Block size when streaming a large WAV into the export
+# Full tracebacks in error dialogs/logs only when debugging (set AUDIOREV_DEBUG=1); otherwise just the error text
+DEBUG_TRACEBACKS = os.environ.get('AUDIOREV_DEBUG', '') not in ('', '0')
+# After the window closes the process exits at once (os._exit), skipping SDL audio and interpreter teardown.
+# Set AUDIOREV_DEBUG_SHUTDOWN=1 for a normal interpreter exit.
+FAST_EXIT = os.environ.get('AUDIOREV_DEBUG_SHUTDOWN', '') in ('', '0')
 # --- End Configuration ---
 
+# --- Data Record ---
+
+class AudioEntry:
+    """
+    One loaded audio file with its scores and (optional) analysis results.
+    Uses __slots__: far smaller than a per-entry dict and faster attribute access.
+    Analysis fields stay None until 'Analyze Audio Features' has run for the entry.
+    The path is kept as an interned directory prefix plus the file name, so the entries of
+    one directory share a single prefix string instead of each holding a full path.
+    """
+    __slots__ = ('filename', '_dir', '_base', 'CE', 'CU', 'PC', 'PQ', 'score_text', '_row_values',
+                 'audio_length_seconds', 'starts_mid_word', 'ends_mid_word', 'confidence')
+
+    def __init__(self, filename, path, CE=None, CU=None, PC=None, PQ=None):
+        self.filename = filename
+        cut = max(path.rfind('/'), path.rfind('\\')) + 1
+        base = path[cut:]
+        self._dir = sys.intern(path[:cut]); self._base = filename if base == filename else base
+        self.CE = CE; self.CU = CU; self.PC = PC; self.PQ = PQ
+        # Scores never change after load, so their table text (CE, CU, PC, PQ) is formatted once here
+        self.score_text = (_format_score(CE), _format_score(CU), _format_score(PC), _format_score(PQ))
+        self.audio_length_seconds = None
+        self.starts_mid_word = None
+        self.ends_mid_word = None
+        self.confidence = None
+        self._row_values = None
+
+    @property
+    def path(self):
+        """Full path of the audio file, as given at load (built on access)."""
+        return self._dir + self._base
+
+    def row_values(self):
+        """
+        Treeview row values, built once and reused across repopulates (reset when analysis updates the entry).
+        Kept as a ready-quoted Tcl list string: given a tuple, ttk would re-quote every value on every insert.
+        """
+        values = self._row_values
+        if values is None:
+            length = self.audio_length_seconds if self.audio_length_seconds is not None else 0 # 0 if not yet analyzed
+            values = self._row_values = _tcl_list((self.filename, *self.score_text, "Yes" if self.starts_mid_word else "No",
+                                                   "Yes" if self.ends_mid_word else "No", length, self.path))
+        return values
+
 # --- Helper Functions ---
 
+# Backslash-escapes every character Tcl's list parser treats specially (whitespace, braces, brackets, quotes, '$', ';', '\\')
+_TCL_LIST_ESCAPES = {**{ord(c): '\\' + c for c in ' {}[]$;"\\'}, ord('\t'): '\\t', ord('\n'): '\\n', ord('\r'): '\\r', ord('\v'): '\\v', ord('\f'): '\\f'}
+
+def _tcl_list(values):
+    """Formats values as a Tcl list string (each value str()-ed and escaped; empty values become '{}')."""
+    return ' '.join(str(v).translate(_TCL_LIST_ESCAPES) or '{}' for v in values)
+
+@functools.lru_cache(maxsize=1)
 def find_ffmpeg():
-    """Checks if ffmpeg is likely available in PATH."""
-    import shutil
+    """Checks if ffmpeg is likely available in PATH (looked up on first use, then memoized)."""
     return shutil.which("ffmpeg") is not None
 
-FFMPEG_AVAILABLE = find_ffmpeg()
+@functools.lru_cache(maxsize=SOUND_CACHE_SIZE)
+def _get_sound(path):
+    """Loads and decodes an audio file for playback (LRU-cached by path; cleared when the dataset changes)."""
+    return pygame.mixer.Sound(path)
+
+def traceback_text(newlines=1):
+    """Returns the current exception's traceback (after `newlines` line breaks) when DEBUG_TRACEBACKS is on, else ''."""
+    return "\n" * newlines + traceback.format_exc() if DEBUG_TRACEBACKS else ""
+
+def _json_parse_line(line):
+    """Parses one JSONL line; retried with json, which (unlike orjson) reads back \\udcxx escapes of undecodable names."""
+    try: return _json_loads(line)
+    except JSONDecodeError:
+        if orjson is None: raise
+        return json.loads(line)
+
+def read_jsonl(file_path, log=print):
+    """
+    Reads a JSONL file and parses each non-empty line. Files up to MMAP_MIN_BYTES are read in
+    one call and decoded as a single JSON array (one parser call for the whole file), falling
+    back to line by line only if that fails; larger ones are streamed through iter_jsonl().
+    Invalid lines are reported through log() and skipped.
+
+    Returns:
+        tuple: (records (list), invalid_line_count (int))
+    """
+    records = []
+    invalid_count = 0
+
+    def count_invalid():
+        nonlocal invalid_count
+        invalid_count += 1
+
+    def parse(line_num, line):
+        try:
+            records.append(_json_parse_line(line))
+        except ValueError:
+            log(f"    Warning: Skipping invalid JSON line {line_num} in {file_path}: {line.decode('utf-8', 'replace').strip()}")
+            count_invalid()
+
+    if os.path.getsize(file_path) >= MMAP_MIN_BYTES:
+        records = list(iter_jsonl(file_path, log, count_invalid))
+        return records, invalid_count
+    with open(file_path, 'rb') as f:
+        raw_lines = f.read().split(b'\n')
+    lines = [line for line in raw_lines if line]
+    try:
+        records = _json_loads(b'[' + b','.join(lines) + b']')
+        if len(records) == len(lines): return records, 0 # Exactly one value per line
+    except JSONDecodeError:
+        pass
+    records = [] # Some line is malformed: parse one by one to skip and report it
+    for line_num, line in enumerate(raw_lines, 1):
+        if line: parse(line_num, line)
+    return records, invalid_count
+
+def iter_jsonl(file_path, log=print, on_invalid=None):
+    """
+    Yields the parsed records of a JSONL file one at a time, straight from a memory map, so
+    neither the file nor the full record list is ever held in memory. Invalid lines are
+    reported through log(), counted through on_invalid() and skipped.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0: return # mmap can't map empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0; line_num = 0
+            while start < size:
+                nl = mm.find(b'\n', start)
+                if nl < 0: nl = size
+                line_num += 1
+                if nl > start:
+                    line = mm[start:nl]
+                    try:
+                        record = _json_parse_line(line)
+                    except ValueError:
+                        log(f"    Warning: Skipping invalid JSON line {line_num} in {file_path}: {line.decode('utf-8', 'replace').strip()}")
+                        if on_invalid: on_invalid()
+                    else:
+                        yield record
+                start = nl + 1
+
+def _to_float(value):
+    """Converts a score value to float, mapping None/invalid values to NaN."""
+    if value is None: return np.nan
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+def _format_score(value):
+    """Formats a score for display: 4 decimals, or 'N/A' when missing/invalid."""
+    value = _to_float(value)
+    return "N/A" if value != value else f"{value:.4f}"
+
+def build_columns(audio_data):
+    """
+    Builds the struct-of-arrays view of audio_data used for filtering and sorting:
+    one float32 array per numeric field (NaN for missing), one bool array per flag
+    field, object arrays for the filenames and the entries themselves, and the lowercased
+    filenames (as a list and as one joined buffer).
+    """
+    n = len(audio_data)
+    columns = {}
+    # Numeric fields are rows of one contiguous matrix so the filter kernel can walk them in one pass
+    numeric = np.empty((len(NUMERIC_COLUMNS), n), dtype=np.float32)
+    nan = np.nan
+    for row, key in enumerate(NUMERIC_COLUMNS):
+        values = [getattr(e, key) for e in audio_data]
+        try:
+            # Fast path: scores are plain numbers or None, converted by NumPy in one call
+            numeric[row] = np.array([nan if v is None else v for v in values], dtype=np.float32)
+        except (ValueError, TypeError):
+            numeric[row] = np.fromiter((_to_float(v) for v in values), dtype=np.float32, count=n) # Odd values -> NaN
+        columns[key] = numeric[row]
+    columns['numeric'] = numeric
+    for key in FLAG_COLUMNS:
+        columns[key] = np.fromiter((bool(getattr(e, key)) for e in audio_data), dtype=bool, count=n)
+    columns['filename'] = np.array([e.filename for e in audio_data], dtype=object)
+    # Lowercased once into one '\0'-separated buffer so the filename filter is a single str.find scan.
+    # name_starts[i] is the offset of entry i; name_starts[n] is one past the end of the buffer.
+    names_lower = [e.filename.lower() for e in audio_data]
+    columns['name_lower'] = names_lower
+    columns['name_buf'] = '\0'.join(names_lower)
+    name_starts = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(s) + 1 for s in names_lower), dtype=np.int64, count=n), out=name_starts[1:])
+    columns['name_starts'] = name_starts
+    # The entries as an object array, so a filtered/sorted view is one fancy-indexing call
+    entry_array = np.empty(n, dtype=object); entry_array[:] = audio_data
+    columns['entry'] = entry_array
+    return columns
+
+def filename_match_indices(columns, needle):
+    """
+    Returns the sorted indices of entries whose lowercased filename contains needle.
+    Scans the joined name buffer with str.find and jumps to the next entry after each hit.
+    Once hits turn out to be dense, the remaining names are tested one by one instead.
+    """
+    buf = columns['name_buf']; starts = columns['name_starts']; names_lower = columns['name_lower']
+    dense_after = max(64, len(names_lower) // 64) # Past this many hits a per-name test beats the per-hit bookkeeping
+    hits = []
+    pos = 0
+    while True:
+        i = buf.find(needle, pos)
+        if i < 0: break
+        seg = int(np.searchsorted(starts, i, side='right')) - 1
+        hits.append(seg)
+        if len(hits) >= dense_after:
+            hits += [j for j, name in enumerate(itertools.islice(names_lower, seg + 1, None), seg + 1) if needle in name]
+            break
+        pos = int(starts[seg + 1])
+    return np.array(hits, dtype=np.intp)
+
+def _range_mask_source(active):
+    """
+    Generates the source of a range-filter kernel specialized for the active bounds.
+    active is a tuple of (row, is_upper) pairs; only those clauses end up in the loop,
+    so unset filters cost nothing per element. A NaN value fails every clause.
+    Rows are independent, so the loop is a prange (plain range unless compiled with parallel=True).
+    """
+    src = ["def _range_mask_spec(values, lows, highs, out):",
+           "    n = values.shape[1]"]
+    for row, is_upper in active:
+        src.append(f"    {'hi' if is_upper else 'lo'}{row} = {'highs' if is_upper else 'lows'}[{row}]")
+    src += ["    for i in prange(n):",
+            "        if not out[i]: continue"]
+    for row, is_upper in active:
+        op, bound = ('<=', f'hi{row}') if is_upper else ('>=', f'lo{row}')
+        src.append(f"        if not values[{row}, i] {op} {bound}:")
+        src.append("            out[i] = False; continue")
+    return "\n".join(src) + "\n"
+
+def _range_mask_numpy(values, lows, highs, out):
+    """ NumPy fallback with the same semantics as the generated kernels. """
+    scratch = np.empty_like(out)
+    for row in range(values.shape[0]):
+        lo = lows[row]; hi = highs[row]
+        if lo == lo:
+            np.greater_equal(values[row], lo, out=scratch); np.logical_and(out, scratch, out=out)
+        if hi == hi:
+            np.less_equal(values[row], hi, out=scratch); np.logical_and(out, scratch, out=out)
+
+_range_mask_kernels = {} # active-bounds signature -> compiled kernel
+
+def _compile_range_kernel(numba, active):
+    """
+    Compiles the kernel for one combination of active bounds. numba can only cache machine code
+    on disk for functions defined in a real source file, so the generated source is written to
+    KERNEL_CACHE_DIR and imported from there: a combination compiled once is loaded, not recompiled,
+    on later runs. Falls back to compiling in memory if the cache directory isn't writable.
+    """
+    source = _range_mask_source(active)
+    parallel = numba.config.NUMBA_NUM_THREADS > 1
+    # No fastmath: the clauses rely on NaN comparisons
+    jit = numba.njit(boundscheck=False, parallel=parallel, cache=KERNEL_CACHE_DIR is not None)
+    if KERNEL_CACHE_DIR:
+        name = '_range_mask_' + hashlib.blake2b(f"{source}|{parallel}".encode('utf-8'), digest_size=8).hexdigest()
+        module_path = os.path.join(KERNEL_CACHE_DIR, f"{name}.py")
+        tmp_path = f"{module_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            if not os.path.exists(module_path):
+                os.makedirs(KERNEL_CACHE_DIR, exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f: f.write("from numba import prange\n\n" + source)
+                os.replace(tmp_path, module_path) # Atomic, so a concurrent compile never imports half a file
+            spec = importlib.util.spec_from_file_location(name, module_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module # numba re-imports the defining module when loading cached code
+            spec.loader.exec_module(module)
+            return jit(module._range_mask_spec)
+        except OSError as e:
+            print(f"Filter kernel cache unavailable ({e}); compiling in memory.")
+            _discard_file(tmp_path)
+            jit = numba.njit(boundscheck=False, parallel=parallel)
+    namespace = {'prange': numba.prange}
+    exec(source, namespace)
+    return jit(namespace['_range_mask_spec'])
+
+def range_mask(values, lows, highs, out):
+    """
+    ANDs the per-row range test of the numeric column matrix into the bool array out (in place).
+    lows/highs hold one bound per row, NaN meaning 'no bound'. With numba installed a kernel
+    containing only the active clauses is generated and compiled once per combination of
+    active filters, multi-threaded when numba has more than one thread; otherwise vectorized
+    NumPy is used.
+    """
+    active = tuple((row, is_upper) for row in range(values.shape[0])
+                   for is_upper, bound in ((False, lows[row]), (True, highs[row])) if bound == bound)
+    if not active: return out
+    kernel = _range_mask_kernels.get(active)
+    if kernel is None:
+        try:
+            import numba
+            kernel = _compile_range_kernel(numba, active)
+        except ImportError:
+            kernel = _range_mask_numpy
+        _range_mask_kernels[active] = kernel
+    kernel(values, lows, highs, out)
+    return out
+
+def warm_up_range_mask():
+    """
+    Compiles the kernel for the most common filter (a PQ minimum) ahead of first use. Run on a
+    background thread at startup: the first numba compile pays for importing numba and
+    initializing LLVM, which would otherwise stall the first Apply Filters by a second or more.
+    """
+    try:
+        start = time.monotonic()
+        lows = np.full(len(NUMERIC_COLUMNS), np.nan, dtype=np.float32); highs = lows.copy()
+        lows[NUMERIC_COLUMNS.index('PQ')] = 0
+        range_mask(np.zeros((len(NUMERIC_COLUMNS), 1), dtype=np.float32), lows, highs, np.ones(1, dtype=bool))
+        print(f"Filter kernel ready in {time.monotonic() - start:.2f}s")
+    except Exception as e:
+        print(f"Filter kernel warm-up failed (filters will compile on first use): {e}")
+
+def posix_abspath(dir_path):
+    """Absolute path of dir_path with forward slashes, as written to paths.jsonl (no Path objects)."""
+    return os.path.abspath(dir_path).replace(os.sep, '/')
+
+def list_file_names(dir_path):
+    """
+    Returns the set of regular file names in dir_path using a single os.scandir pass
+    (DirEntry caches the file type, so no extra stat per entry). None if dir_path is not
+    an existing directory, empty set on other errors (e.g. a directory that can't be listed).
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return {e.name for e in it if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
+        return set()
+
+def _load_one_subdir(subdir_path):
+    """
+    Loads paths.jsonl/scores.jsonl from a single directory. Safe to run in a worker thread:
+    warnings are collected and returned instead of printed.
+
+    Returns:
+        tuple: (entries (list), invalid_count (int), found_files (bool), messages (list of str),
+                failed (bool): True if the directory or its files could not be read, so the result shouldn't be cached)
+    """
+    entries = []
+    invalid_count = 0
+    messages = []
+    paths_file = os.path.join(subdir_path, PATHS_FILENAME)
+    scores_file = os.path.join(subdir_path, SCORES_FILENAME)
+
+    # One directory read answers both existence checks
+    file_names = list_file_names(subdir_path)
+    if file_names is None or PATHS_FILENAME not in file_names or SCORES_FILENAME not in file_names:
+        return entries, invalid_count, False, messages, file_names is None
+
+    def count_invalid_path():
+        nonlocal invalid_count
+        invalid_count += 1
+
+    try:
+        # Large files are streamed in lockstep so the parsed records of both never sit in memory
+        # at once (the line count check then happens after the pass); small ones are read whole.
+        streamed = max(os.path.getsize(paths_file), os.path.getsize(scores_file)) >= MMAP_MIN_BYTES
+        if streamed:
+            paths_iter = iter_jsonl(paths_file, messages.append, count_invalid_path)
+            # Avoid double counting if both files have issues on same conceptual line
+            scores_iter = iter_jsonl(scores_file, messages.append)
+            stream_end = object() # Fill value once the shorter file runs out
+            pairs = itertools.zip_longest(paths_iter, scores_iter, fillvalue=stream_end)
+        else:
+            # Read both files in a single pass each, handling invalid lines
+            paths_content, paths_invalid = read_jsonl(paths_file, messages.append)
+            invalid_count += paths_invalid
+            # Avoid double counting if both files have issues on same conceptual line
+            scores_content, _ = read_jsonl(scores_file, messages.append)
+
+            if len(paths_content) != len(scores_content):
+                messages.append(f"    Warning: Mismatch in valid line count between {paths_file} ({len(paths_content)}) and {scores_file} ({len(scores_content)}). Skipping this subdirectory.")
+                return entries, invalid_count, True, messages, False
+            pairs = zip(paths_content, scores_content)
+
+        # Audio files usually share a few parent directories: read each parent once and
+        # answer the existence checks from the cached name sets instead of one stat per file.
+        # The common case is files next to paths.jsonl, and that directory was just listed above
+        # (keyed the way create_wav_jsonl writes it: absolute with forward slashes).
+        existing_by_parent = {posix_abspath(subdir_path): file_names}
+        split_path = os.path.split; cached_names = existing_by_parent.get; add_entry = entries.append # Hoisted out of the loop
+
+        pair_count = 0
+        for pair_count, (path_data, score_data) in enumerate(pairs, 1):
+            if streamed and (path_data is stream_end or score_data is stream_end): break # Line count mismatch
+            full_path_str = path_data.get("path")
+            if not full_path_str:
+                messages.append(f"    Warning: Missing 'path' key in {paths_file}. Skipping entry.")
+                invalid_count += 1
+                continue
+
+            # Check if the file *actually* exists before adding (plain string ops, no Path objects)
+            parent, name = split_path(full_path_str)
+            existing = cached_names(parent)
+            if existing is None:
+                # A parent that isn't a directory holds none of its files: cache it as False so
+                # its entries are rejected without a stat each (the failed scandir is the only check)
+                parent_names = list_file_names(parent or '.')
+                existing = existing_by_parent[parent] = False if parent_names is None else parent_names
+            # Fall back to a real stat on a miss (e.g. case-insensitive filesystems)
+            if existing is False or (name not in existing and not os.path.isfile(full_path_str)):
+                messages.append(f"    Warning: Path '{full_path_str}' from {paths_file} not found on disk. Skipping.")
+                invalid_count += 1
+                continue
+
+            score = score_data.get
+            add_entry(AudioEntry(name, full_path_str, # Already a plain string path
+                                 score('CE'), score('CU'), score('PC'), score('PQ')))
+
+        if streamed and pair_count and (path_data is stream_end or score_data is stream_end):
+            # Count the rest of the longer file for the message, then drop what was built
+            paths_total = pair_count - (path_data is stream_end) + sum(1 for _ in paths_iter)
+            scores_total = pair_count - (score_data is stream_end) + sum(1 for _ in scores_iter)
+            messages.append(f"    Warning: Mismatch in valid line count between {paths_file} ({paths_total}) and {scores_file} ({scores_total}). Skipping this subdirectory.")
+            entries = []
+    except Exception as e:
+        messages.append(f"    Error processing directory {subdir_path}: {e}{traceback_text()}")
+        invalid_count += 1 # Count errors during processing as invalid
+        return entries, invalid_count, True, messages, True
+
+    return entries, invalid_count, True, messages, False
+
+def _subdir_signature(subdir_path):
+    """
+    (mtime_ns, size) of a directory and its two JSONL files, or None if any is missing. The
+    directory's own mtime also changes when audio files next to the JSONL files come or go.
+    """
+    try:
+        return tuple((st.st_mtime_ns, st.st_size) for st in map(os.stat, (subdir_path, os.path.join(subdir_path, PATHS_FILENAME), os.path.join(subdir_path, SCORES_FILENAME))))
+    except OSError:
+        return None
+
+def _load_cache_path(base_dir, search_subdirs):
+    """Cache file for one base directory / subdirectory-mode combination."""
+    key = hashlib.blake2b(f"{os.path.abspath(base_dir)}|{search_subdirs}".encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(LOAD_CACHE_DIR, f"{key}.pickle")
+
+def _read_load_cache(cache_path):
+    """Returns {dir: (signature, rows, invalid_count, found_files, messages)} from the cache file, or {} if unusable."""
+    try:
+        with open(cache_path, 'rb') as f:
+            version, results = pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Ignoring unreadable load cache {cache_path}: {e}")
+        return {}
+    return results if version == LOAD_CACHE_VERSION else {}
+
+def _write_load_cache(cache_path, results):
+    """Writes the cache atomically (temporary file, then rename); failures only cost the next load its speed-up."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((LOAD_CACHE_VERSION, results), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError) as e:
+        print(f"Could not write load cache {cache_path}: {e}")
+        _discard_file(tmp_path)
+
+def _scan_cache_path(base_dir):
+    """Preprocessing scan cache file for one base directory (kept next to the load cache)."""
+    key = hashlib.blake2b(os.path.abspath(base_dir).encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(LOAD_CACHE_DIR, f"{key}.scan.json")
+
+def _scan_signature(subdir_path):
+    """
+    [mtime_ns, inode, size] of a directory followed by [mtime_ns, size] of its paths.jsonl, or None.
+    While it is unchanged no file came or went and paths.jsonl wasn't rewritten, so it still lists the WAVs.
+    """
+    try:
+        d = os.stat(subdir_path); p = os.stat(os.path.join(subdir_path, PATHS_FILENAME))
+    except OSError:
+        return None
+    return [d.st_mtime_ns, d.st_ino, d.st_size, p.st_mtime_ns, p.st_size]
+
+def _read_scan_cache(cache_path):
+    """Returns {subdir path: signature + [WAV count]} from the scan cache, or {} if unusable."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = _json_loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, JSONDecodeError) as e:
+        print(f"Ignoring unreadable scan cache {cache_path}: {e}")
+        return {}
+    return cache.get('dirs', {}) if isinstance(cache, dict) and cache.get('version') == LOAD_CACHE_VERSION else {}
+
+def _write_scan_cache(cache_path, dirs):
+    """Writes the scan cache atomically (temporary file, then rename); failures are only logged."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps({'version': LOAD_CACHE_VERSION, 'dirs': dirs}))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Could not write scan cache {cache_path}: {e}")
+        _discard_file(tmp_path)
 
 def load_audio_data(base_dir, search_subdirs, update_status_callback):
     """
     Loads audio paths and scores from subdirectories of base_dir.
     Looks for paths.jsonl and scores.jsonl in each immediate subdirectory.
+    Subdirectories are loaded concurrently (the work is I/O-bound and releases the GIL);
+    results are merged in directory listing order. Directories whose JSONL files and listing
+    are unchanged since the last load are taken from the on-disk cache instead of re-parsed.
     """
-    all_data = []
     if not base_dir or not os.path.isdir(base_dir): 
         return [], "Selected path is not a valid directory.", 0
 
@@ -46,126 +591,67 @@ def load_audio_data(base_dir, search_subdirs, update_status_callback):
     found_files_flag = False
     subdirs_scanned = 0
     invalid_entries_count = 0
-    
-    
-    if search_subdirs:
-        for item in os.listdir(base_dir):
-            subdir_path = os.path.join(base_dir, item)
-            if os.path.isdir(subdir_path):
-                subdirs_scanned += 1
-                paths_file = os.path.join(subdir_path, PATHS_FILENAME)
-                scores_file = os.path.join(subdir_path, SCORES_FILENAME)
-                
-                if subdirs_scanned == 1: 
-                    update_status_callback(f"Found {len(os.listdir(base_dir))} subdirectories. Scanning...")
-
-                update_status_callback(f"Loading data from subdirectory: {item}")
-
-                if os.path.exists(paths_file) and os.path.exists(scores_file):
-                    found_files_flag = True
-                    try:
-                        paths_content = []
-                        scores_content = []
-                        # Read paths file line by line, handling potential errors
-                        with open(paths_file, 'r', encoding='utf-8') as pf:
-                            for line_num, line in enumerate(pf):
-                                try:
-                                    paths_content.append(json.loads(line))
-                                except json.JSONDecodeError:
-                                    print(f"    Warning: Skipping invalid JSON line {line_num+1} in {paths_file}: {line.strip()}")
-                                    invalid_entries_count += 1
-                        # Read scores file line by line
-                        with open(scores_file, 'r', encoding='utf-8') as sf:
-                            for line_num, line in enumerate(sf):
-                                try:
-                                    scores_content.append(json.loads(line))
-                                except json.JSONDecodeError:
-                                    print(f"    Warning: Skipping invalid JSON line {line_num+1} in {scores_file}: {line.strip()}")
-                                    # Avoid double counting if both files have issues on same conceptual line
-                                    # invalid_entries_count += 1
-
-                        if len(paths_content) != len(scores_content):
-                            print(f"    Warning: Mismatch in valid line count between {paths_file} ({len(paths_content)}) and {scores_file} ({len(scores_content)}). Skipping this subdirectory.")
-                            continue
-
-                        for path_data, score_data in zip(paths_content, scores_content):
-                            full_path_str = path_data.get("path")
-                            if not full_path_str:
-                                print(f"    Warning: Missing 'path' key in {paths_file}. Skipping entry.")
-                                invalid_entries_count += 1
-                            full_path = Path(full_path_str)
-
-                            # Check if the file *actually* exists before adding
-                            if not full_path.is_file():
-                                print(f"    Warning: Path '{full_path_str}' from {paths_file} not found on disk. Skipping.")
-                                invalid_entries_count += 1
-                                continue
-
-                            entry = {
-                                'filename': full_path.name,
-                                'path': str(full_path), # Store standard string path
-                                'CE': score_data.get('CE', None),
-                                'CU': score_data.get('CU', None),
-                                'PC': score_data.get('PC', None),
-                                'PQ': score_data.get('PQ', None),
-                            }
-                            all_data.append(entry)
-                    except Exception as e:
-                        print(f"    Error processing subdirectory {item}: {e}\n{traceback.format_exc()}")
-                        invalid_entries_count += 1 # Count errors during processing as invalid
 
-                update_status_callback(f"Finished processing files in subdirectory: {item}")
+    if search_subdirs:
+        try:
+            with os.scandir(base_dir) as it:
+                subdir_entries = [e for e in it if e.is_dir()]
+        except OSError as e:
+            return [], f"Could not list subdirectories in {base_dir}: {e}", 0
+        update_status_callback(f"Found {len(subdir_entries)} subdirectories. Scanning...")
+        load_dirs = [e.path for e in subdir_entries]
     else:
-        paths_file = os.path.join(base_dir, PATHS_FILENAME)
-        scores_file = os.path.join(base_dir, SCORES_FILENAME)
+        load_dirs = [base_dir]
+
+    cache_path = _load_cache_path(base_dir, search_subdirs) if LOAD_CACHE_DIR else None
+    cached = _read_load_cache(cache_path) if cache_path else {}
+    fresh = {} # Results to cache for the next load (only directories that still exist)
+
+    def load_dir(dir_path):
+        signature = _subdir_signature(dir_path) # Taken before reading, so a concurrent edit invalidates the entry
+        hit = cached.get(dir_path)
+        if signature is not None and hit is not None and hit[0] == signature:
+            fresh[dir_path] = hit
+            _, rows, invalid_count, found_files, messages = hit
+            return [AudioEntry(*row) for row in rows], invalid_count, found_files, messages
+        entries, invalid_count, found_files, messages, failed = _load_one_subdir(dir_path)
+        # A read error (e.g. permissions, later fixed with chmod) doesn't change the signature, so it isn't cached
+        if signature is not None and not failed:
+            fresh[dir_path] = (signature, [(e.filename, e.path, e.CE, e.CU, e.PC, e.PQ) for e in entries], invalid_count, found_files, messages)
+        return entries, invalid_count, found_files, messages
+
+    max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(load_dirs)))
+    last_tick = time.monotonic()
+    # A single directory gains nothing from a pool; map() keeps the same interface for both cases
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) if len(load_dirs) > 1 else None
+    entry_lists = [] # Per-directory results, merged once their total size is known
+    try:
+        results = executor.map(load_dir, load_dirs) if executor else map(load_dir, load_dirs)
+        for dir_path, result in zip(load_dirs, results):
+            entries, invalid_count, found_files, messages = result
+            if search_subdirs: subdirs_scanned += 1
+            for message in messages: print(message)
+            found_files_flag = found_files_flag or found_files
+            invalid_entries_count += invalid_count
+            if entries: entry_lists.append(entries)
+            # Progress at most every 0.1s rather than once per subdirectory
+            if search_subdirs and time.monotonic() - last_tick >= 0.1:
+                last_tick = time.monotonic()
+                update_status_callback(f"Processed {subdirs_scanned}/{len(load_dirs)} subdirectories (last: {os.path.basename(dir_path)})...")
+    finally:
+        if executor: executor.shutdown()
 
-        if os.path.exists(paths_file) and os.path.exists(scores_file):
-            found_files_flag = True
-            try:
-                paths_content, scores_content = [],[]
-                with open(paths_file, 'r', encoding='utf-8') as pf:
-                    for line_num, line in enumerate(pf):
-                        try:
-                            paths_content.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            print(f"    Warning: Skipping invalid JSON line {line_num+1} in {paths_file}: {line.strip()}")
-                            invalid_entries_count += 1
-                with open(scores_file, 'r', encoding='utf-8') as sf:
-                    for line_num, line in enumerate(sf):
-                        try:
-                            scores_content.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            print(f"    Warning: Skipping invalid JSON line {line_num+1} in {scores_file}: {line.strip()}")
-
-                if len(paths_content) != len(scores_content):
-                    print(f"    Warning: Mismatch in valid line count between {paths_file} ({len(paths_content)}) and {scores_file} ({len(scores_content)}). Skipping this subdirectory.")
-                else:
-                    for path_data, score_data in zip(paths_content, scores_content):
-                        full_path_str = path_data.get("path")
-                        full_path = Path(full_path_str)
-                        if not full_path_str:
-                            print(f"    Warning: Missing 'path' key in {paths_file}. Skipping entry.")
-                            invalid_entries_count += 1
-                            continue
-
-
-                        entry = {
-                            'filename': full_path.name,
-                            'path': str(full_path),
-                            'CE': score_data.get('CE', None),
-                            'CU': score_data.get('CU', None),
-                            'PC': score_data.get('PC', None),
-                            'PQ': score_data.get('PQ', None),
-                        }
-
-                        if not full_path.is_file():
-                             print(f"    Warning: Path '{full_path_str}' from {paths_file} not found on disk. Skipping.")
-                             invalid_entries_count += 1
-                             continue
-                        all_data.append(entry)
-            except Exception as e:
-                print(f"    Error processing directory: {e}\n{traceback.format_exc()}")
-                invalid_entries_count += 1
+    if cache_path and (fresh.keys() != cached.keys() or any(fresh[d] is not cached[d] for d in fresh)):
+        _write_load_cache(cache_path, fresh) # Something was (re-)parsed or disappeared
+
+    if len(entry_lists) == 1:
+        all_data = entry_lists[0] # Nothing to merge
+    else:
+        # Allocate the merged list once and block-copy each directory's entries into place
+        all_data = [None] * sum(len(entries) for entries in entry_lists); pos = 0
+        for entries in entry_lists:
+            all_data[pos:pos + len(entries)] = entries; pos += len(entries)
+    del entry_lists
 
     print(f"Finished scanning {subdirs_scanned} subdirectories.")
     update_status_callback(f"Finished scanning {subdirs_scanned} subdirectories.")
@@ -186,22 +672,25 @@ def add_audio_features(audio_data):
     Modifies the audio_data list in place.
     """
     for entry in audio_data:
-        full_path_str = entry["path"]
+        full_path_str = entry.path
+        entry._row_values = None # Cached table row is stale once the features change
         try:
-            entry["audio_length_seconds"] = librosa.get_duration(path=full_path_str)
+            entry.audio_length_seconds = librosa.get_duration(path=full_path_str)
         except Exception as e:
             print(f"    Error getting duration for {full_path_str}: {e}")
-            entry["audio_length_seconds"] = 0
+            entry.audio_length_seconds = 0
 
         try:
-            entry.update(detect_mid_word_clips(full_path_str))
+            features = detect_mid_word_clips(full_path_str)
+            entry.starts_mid_word = features["starts_mid_word"]
+            entry.ends_mid_word = features["ends_mid_word"]
+            entry.confidence = features["confidence"]
+            entry.audio_length_seconds = features["audio_length_seconds"]
         except Exception as e:
             print(f"    Error in mid-word detection for {full_path_str}: {e}")
-            entry.update({
-                "starts_mid_word": False,
-                "ends_mid_word": False,
-                "confidence": {"start": 0, "end": 0},
-            })
+            entry.starts_mid_word = False
+            entry.ends_mid_word = False
+            entry.confidence = {"start": 0, "end": 0}
     return audio_data
 
 def create_wav_jsonl(target_dir, output_filename="paths.jsonl", progress_callback=None):
@@ -218,62 +707,77 @@ def create_wav_jsonl(target_dir, output_filename="paths.jsonl", progress_callbac
     Returns:
         tuple: (count, message) where count is number of WAVs found, or -1 on error.
     """
-    wav_filenames = []
-    all_files = []
+    wav_names = []
     try:
-        all_files = os.listdir(target_dir)
-        wav_filenames = [f for f in all_files if f.lower().endswith('.wav')]
+        with os.scandir(target_dir) as it:
+            # is_file() answers from the directory listing's file type; only symlinks cost a stat.
+            # Just the names are kept (not the DirEntry objects); only names not ending in '.wav' are lowercased.
+            wav_names = [e.name for e in it if (e.name.endswith('.wav') or e.name[-4:].lower() == '.wav') and e.is_file()]
     except OSError as e:
          return -1, f"OSError listing files in {target_dir}: {e}"
     except Exception as e:
         return -1, f"Unexpected error listing files in {target_dir}: {e}"
 
-    total_wavs = len(wav_filenames)
+    total_wavs = len(wav_names)
     output_path = os.path.join(target_dir, output_filename)
     count = 0
+    PROGRESS_INTERVAL = 0.1 # seconds between progress callbacks
+    WRITE_CHUNK = 10000 # paths per buffered write
 
     if progress_callback:
         progress_callback(0, total_wavs, f"Scanning {total_wavs} WAVs...")
+    last_tick = time.monotonic()
 
+    # Absolute POSIX-style directory prefix, computed once (forward slashes for cross-platform compatibility)
+    base_posix = posix_abspath(target_dir)
+    if not base_posix.endswith('/'): base_posix += '/'
+    # Records go to a '.part' file next to the output, which only replaces output_filename once complete
+    partial_path = output_path + '.part'
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, wav_file in enumerate(wav_filenames):
-                try:
-                    # Get the absolute path relative to the filesystem root
-                    full_path = os.path.abspath(os.path.join(target_dir, wav_file))
-                    # Ensure cross-platform compatibility (forward slashes recommended)
-                    full_path_posix = Path(full_path).as_posix()
-                    entry = {"path": full_path_posix}
-                    f.write(json.dumps(entry) + '\n')
-                    count += 1
-                except Exception as e_inner:
-                    print(f"  Error processing file {wav_file}: {e_inner}", file=sys.stderr)
-                    # Continue with other files
-
-                # Report progress periodically
-                if progress_callback and (i + 1) % 100 == 0: # Update every 100 files
-                    progress_callback(i + 1, total_wavs, f"Writing paths.jsonl ({i+1}/{total_wavs})...")
+        # The prefix is JSON-escaped once; names that need no escaping are then joined into the records as plain text
+        record_sep = '"}\n{"path":"' + _json_dumps(base_posix)[1:-1].decode('utf-8')
+        with open(partial_path, 'wb', buffering=0) as f: # Writes are whole chunks; no Python-side buffer needed
+            for chunk_start in range(0, total_wavs, WRITE_CHUNK):
+                names = wav_names[chunk_start:chunk_start + WRITE_CHUNK]
+                data = None
+                joined = ''.join(names)
+                if '"' not in joined and '\\' not in joined and joined.isprintable(): # No quotes, backslashes or control characters
+                    data = (record_sep[3:] + record_sep.join(names) + '"}\n').encode('utf-8') # One encode per chunk
+                if data is None:
+                    # Only the path string is JSON-encoded; the fixed {"path":...} wrapper is joined around it
+                    chunk = [_json_dumps(base_posix + name) for name in names]
+                    data = b'{"path":' + b'}\n{"path":'.join(chunk) + b'}\n'
+                f.write(data) # One write per chunk instead of one per file
+                count += len(names)
+
+                # Report progress at most every PROGRESS_INTERVAL
+                done = min(chunk_start + WRITE_CHUNK, total_wavs)
+                if progress_callback and done < total_wavs:
+                    now = time.monotonic()
+                    if now - last_tick >= PROGRESS_INTERVAL:
+                        last_tick = now
+                        progress_callback(done, total_wavs, f"Writing paths.jsonl ({done}/{total_wavs})...")
+        os.replace(partial_path, output_path)
 
         # Final update
         if progress_callback:
             progress_callback(count, total_wavs, f"Finished paths.jsonl ({count}/{total_wavs}).")
 
-        # Check if count matches total_wavs, could indicate errors processing some files
-        if count != total_wavs:
-             print(f"  Warning: Found {total_wavs} WAV files but only wrote {count} paths to {output_filename}. Check for errors above.", file=sys.stderr)
-
         return count, f"Created {output_filename} with {count} WAV entries."
 
     except OSError as e:
+        _discard_file(partial_path)
         return -1, f"OSError creating {output_filename} in {target_dir}: {e}"
     except Exception as e:
-        return -1, f"Unexpected error creating {output_filename} in {target_dir}: {e}\n{traceback.format_exc()}"
+        _discard_file(partial_path)
+        return -1, f"Unexpected error creating {output_filename} in {target_dir}: {e}{traceback_text()}"
 
 
-def run_audio_aes(target_dir, audio_aes_command, input_jsonl="paths.jsonl", output_jsonl="scores.jsonl", batch_size=100):
+def run_audio_aes(target_dir, audio_aes_command, input_jsonl="paths.jsonl", output_jsonl="scores.jsonl", batch_size=100,
+                  line_callback=None, stop_event=None):
     """
     Runs the audio-aes command within the target_dir and returns success status
-    and a detailed message including captured stdout/stderr.
+    and a detailed message including captured stderr.
 
     Args:
         target_dir (str): The directory where the command should be run and files exist.
@@ -281,6 +785,8 @@ def run_audio_aes(target_dir, audio_aes_command, input_jsonl="paths.jsonl", outp
         input_jsonl (str): The name of the input JSONL file (relative to target_dir).
         output_jsonl (str): The name of the output JSONL file (relative to target_dir).
         batch_size (int): The batch size for the audio-aes command.
+        line_callback (callable, optional): Called with each stderr line (without newline) as it arrives.
+        stop_event (threading.Event, optional): When set, the running command is terminated.
 
     Returns:
         tuple: (success (bool), detailed_message (str))
@@ -305,59 +811,175 @@ def run_audio_aes(target_dir, audio_aes_command, input_jsonl="paths.jsonl", outp
     cmd_str = ' '.join(command)
     print(f"  Running command in {target_dir}: {cmd_str}") # Console log
 
+    # Scores are streamed straight from the child's stdout into a temporary file next to the
+    # output (no in-memory copy); it only replaces output_jsonl once the command succeeded.
+    # Stderr is read as raw bytes line by line on a helper thread; only the last lines are kept
+    # and they are decoded only when reported (live through line_callback, or in the final message).
+    partial_path = output_path + '.part'
+    stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
     try:
-        process = subprocess.run(
-            command,
-            cwd=target_dir,
-            capture_output=True,
-            text=True,
-            check=True, # Raise CalledProcessError on non-zero exit
-            encoding='utf-8',
-            errors='replace'
-        )
-
-        # Write captured stdout (scores) to the output file
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f_out:
-                f_out.write(process.stdout)
-        except OSError as e:
-             write_error_msg = f"ERROR writing output file {output_path}: {e}"
-             # Include command output if available, but report failure
-             combined_output = f"Command seemed to succeed but failed to write scores.jsonl: {e}\n"
-             if process.stderr: combined_output += f"--- Command Stderr ---\n{process.stderr.strip()}\n"
-             if process.stdout: combined_output += f"--- Command Stdout (Scores) ---\n{process.stdout.strip()}"
-             return False, combined_output
-
-        # Construct detailed success message including stdout/stderr
-        msg = f"Command executed successfully. Output written to {output_jsonl}."
-        # Append stderr first if it exists
-        if process.stderr:
-            msg += f"\n--- Command Standard Error ---\n{process.stderr.strip()}"
-        # Append stdout (which includes scores, logs, progress)
-        if process.stdout:
-            msg += f"\n--- Command Standard Output ---\n{process.stdout.strip()}"
+        with open(partial_path, 'wb', buffering=0) as f_out: # Only the child writes to it; no Python-side buffer
+            process = subprocess.Popen(
+                command,
+                cwd=target_dir,
+                stdout=f_out,
+                stderr=subprocess.PIPE
+            )
+
+        def pump_stderr():
+            for line in process.stderr:
+                stderr_tail.append(line)
+                if line_callback: line_callback(line.decode('utf-8', 'replace').rstrip())
+        reader = threading.Thread(target=pump_stderr, daemon=True)
+        reader.start()
+
+        stopped = False
+        while True:
+            try:
+                process.wait(timeout=0.2)
+                break
+            except subprocess.TimeoutExpired:
+                if stop_event is not None and stop_event.is_set():
+                    stopped = True
+                    process.terminate()
+                    try: process.wait(timeout=5)
+                    except subprocess.TimeoutExpired: process.kill(); process.wait()
+                    break
+        if stopped:
+            # Don't wait on grandchildren that may still hold the stderr pipe open
+            reader.join(timeout=1)
+        else:
+            reader.join()
+            process.stderr.close()
+
+        # Stderr lines were already reported live when a callback is given
+        stderr_text = "" if line_callback else b"".join(stderr_tail).decode('utf-8', 'replace').strip()
+
+        if stopped:
+            _discard_file(partial_path)
+            return False, f"Command terminated: stop was requested (exit code {process.returncode})."
+
+        if process.returncode != 0:
+            # Construct detailed error message including captured output
+            err_msg = f"ERROR running command. Exit code: {process.returncode}"
+            # Include stderr and the tail of stdout for debugging
+            if stderr_text:
+                err_msg += f"\n--- Command Standard Error (last {len(stderr_tail)} lines) ---\n{stderr_text}"
+            stdout_tail = _read_file_tail(partial_path)
+            if stdout_tail:
+                 err_msg += f"\n--- Command Standard Output (last {len(stdout_tail)} chars before error) ---\n{stdout_tail.strip()}"
+            _discard_file(partial_path)
+            return False, err_msg
+
+        os.replace(partial_path, output_path)
+
+        # Construct detailed success message including stderr
+        msg = f"Command executed successfully. Output written to {output_jsonl} ({os.path.getsize(output_path)} bytes)."
+        if stderr_text:
+            msg += f"\n--- Command Standard Error (last {len(stderr_tail)} lines) ---\n{stderr_text}"
 
         return True, msg # Return success and the combined output message
 
     except FileNotFoundError:
         err_msg = f"ERROR: Command '{audio_aes_command}' not found. Make sure it's installed and in your system PATH."
-        return False, err_msg
-    except subprocess.CalledProcessError as e:
-        # Construct detailed error message including captured output
-        err_msg = f"ERROR running command. Exit code: {e.returncode}"
-        # Include stderr and stdout for debugging
-        if e.stderr:
-            err_msg += f"\n--- Command Standard Error ---\n{e.stderr.strip()}"
-        if e.stdout:
-             err_msg += f"\n--- Command Standard Output (before error) ---\n{e.stdout.strip()}"
+        _discard_file(partial_path)
         return False, err_msg
     except OSError as e:
         err_msg = f"ERROR: OSError during command execution or writing output {output_path}: {e}"
+        _discard_file(partial_path)
         return False, err_msg
     except Exception as e:
-        err_msg = f"ERROR: Unexpected error running {audio_aes_command}: {e}\n{traceback.format_exc()}"
+        err_msg = f"ERROR: Unexpected error running {audio_aes_command}: {e}{traceback_text()}"
+        _discard_file(partial_path)
         return False, err_msg
 
+def scores_file_complete(file_path):
+    """
+    True if file_path is a non-empty file ending in a newline, False if it is empty, cut off or unreadable,
+    None if it doesn't exist. Used to decide whether an existing scores.jsonl can be kept: one open,
+    one fstat and a one-byte read (no separate existence check, no parsing).
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0: return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+    except FileNotFoundError:
+        return None
+    except OSError:
+        return False
+
+def _read_file_tail(file_path, max_bytes=4096):
+    """ Returns the last max_bytes of a file decoded as UTF-8 (empty string if unreadable). """
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - max_bytes))
+            return f.read().decode('utf-8', 'replace')
+    except OSError:
+        return ""
+
+def _discard_file(file_path):
+    """ Removes a temporary file, ignoring errors (e.g. if it was never created). """
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+def combine_paths_files(input_paths, combined_path):
+    """
+    Concatenates several paths.jsonl files into combined_path, so one audio-aes run can score them all.
+
+    Returns:
+        list: The number of lines taken from each input file, in order (used to split the scores again).
+    """
+    line_counts = []
+    with open(combined_path, 'wb') as f_out:
+        for input_path in input_paths:
+            count = 0; last = b'\n'
+            with open(input_path, 'rb') as f_in:
+                for block in iter(functools.partial(f_in.read, EXPORT_BLOCK_BYTES), b''):
+                    f_out.write(block); count += block.count(b'\n'); last = block[-1:]
+            if last != b'\n': f_out.write(b'\n'); count += 1 # Last line had no newline; keep files from merging
+            line_counts.append(count)
+    return line_counts
+
+def make_transient_dir():
+    """
+    Creates a private temporary directory for files that are only needed while a job runs.
+    Uses /dev/shm (RAM) when it is writable, so they never touch a slow or network disk.
+    """
+    shm_dir = '/dev/shm'
+    return tempfile.mkdtemp(prefix='audiorev-', dir=shm_dir if os.path.isdir(shm_dir) and os.access(shm_dir, os.W_OK) else None)
+
+def split_scores_file(combined_scores_path, output_paths, line_counts):
+    """
+    Splits the scores of a combined audio-aes run back into one scores file per directory.
+    Line i of the scores belongs to line i of the combined paths file, so each output gets the
+    next line_counts[k] lines. A final line without a newline counts as a line (and gets one).
+    Outputs are written to a '.part' file and renamed when complete.
+
+    Returns:
+        tuple: (success (bool), message (str)); nothing is written if the line count doesn't match.
+    """
+    total = 0; last = b'\n'
+    with open(combined_scores_path, 'rb') as f:
+        for block in iter(functools.partial(f.read, EXPORT_BLOCK_BYTES), b''):
+            total += block.count(b'\n'); last = block[-1:]
+    if last != b'\n': total += 1 # Unterminated last line
+    if total != sum(line_counts):
+        return False, f"Combined output has {total} lines but {sum(line_counts)} paths were given; scores can't be matched to directories."
+    with open(combined_scores_path, 'rb') as f_in:
+        for output_path, count in zip(output_paths, line_counts):
+            partial_path = output_path + '.part'
+            try:
+                with open(partial_path, 'wb') as f_out:
+                    f_out.writelines(line if line.endswith(b'\n') else line + b'\n' for line in itertools.islice(f_in, count))
+                os.replace(partial_path, output_path)
+            except OSError:
+                _discard_file(partial_path); raise
+    return True, f"Split {total} scores into {len(output_paths)} files."
+
 def detect_mid_word_clips(audio_file, energy_threshold=0.05, zcr_threshold=0.1, edge_frames=1500):
     """
     Detect if audio starts/ends mid-word using energy and zero-crossing rate.
@@ -403,7 +1025,7 @@ def detect_mid_word_clips(audio_file, energy_threshold=0.05, zcr_threshold=0.1,
                 "end": end_energy / mid_energy
             },
             "audio_length_seconds": audio_length_seconds,
-            "file": Path(audio_file).name
+            "file": os.path.basename(audio_file)
         }
     except Exception as e:
         print(f"Error processing {audio_file}: {e}")
@@ -415,7 +1037,7 @@ def detect_mid_word_clips(audio_file, energy_threshold=0.05, zcr_threshold=0.1,
                 "end": 0
             },
             "audio_length_seconds": 0,
-            "file": Path(audio_file).name
+            "file": os.path.basename(audio_file)
         }
 
 def calculate_audio_length(audio_file):
@@ -428,11 +1050,105 @@ def calculate_audio_length(audio_file):
 
 def process_audio_folder(folder_path, output_csv=None):
     """Process all audio files in a folder and return/save results"""
-    folder = Path(folder_path)
-    audio_extensions = [".mp3", ".wav", ".flac", ".ogg", ".m4a"]
-    audio_files = [f for ext in audio_extensions for f in folder.glob(f"*{ext}")]
+    audio_extensions = {".mp3", ".wav", ".flac", ".ogg", ".m4a"}
+    # One scandir pass instead of a glob (directory read) per extension
+    with os.scandir(folder_path) as it:
+        audio_files = [Path(e.path) for e in it if os.path.splitext(e.name)[1] in audio_extensions and e.is_file()]
     
 
+# --- Audio Export ---
+
+# ffmpeg raw PCM sample format per WAV sample width (8-bit WAV is unsigned)
+_PCM_FORMATS = {1: 'u8', 2: 's16le', 3: 's24le', 4: 's32le'}
+
+def read_wav_frames(file_path, max_bytes=None):
+    """
+    Reads all PCM frames of a WAV file.
+    Uses the wave module; WAV variants it can't parse (e.g. float or extensible) go through pydub.
+    If the frame data is larger than max_bytes, only the header is read and frames is None
+    (the caller streams the file with AudioConcatWriter.write_file instead).
+
+    Returns:
+        tuple: ((channels, sample_width, frame_rate), frames (bytes or None))
+    """
+    try:
+        with wave.open(file_path, 'rb') as w:
+            params = (w.getnchannels(), w.getsampwidth(), w.getframerate())
+            if max_bytes is not None and w.getnframes() * params[0] * params[1] > max_bytes: return params, None
+            return params, w.readframes(w.getnframes())
+    except wave.Error:
+        segment = AudioSegment.from_wav(file_path)
+        return (segment.channels, segment.sample_width, segment.frame_rate), segment.raw_data
+
+class AudioConcatWriter:
+    """
+    Streams PCM frames from several files into one output file, one file at a time.
+    The first file's (channels, sample_width, frame_rate) sets the output format; later files
+    that differ are converted with pydub. WAV is written with the wave module, any other
+    format by piping raw PCM into a single ffmpeg process.
+    """
+    def __init__(self, output_path, output_format):
+        self.output_path = output_path
+        self.output_format = output_format
+        self.params = None
+        self._wav = None; self._process = None; self._ffmpeg_log = None
+
+    def write(self, params, frames):
+        if self.params is None: self._open(params)
+        elif params != self.params:
+            channels, sample_width, frame_rate = self.params
+            segment = AudioSegment(data=frames, channels=params[0], sample_width=params[1], frame_rate=params[2])
+            frames = segment.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(sample_width).raw_data
+        if self._wav is not None: self._wav.writeframesraw(frames)
+        else: self._process.stdin.write(frames)
+
+    def write_file(self, params, file_path):
+        """ Streams a WAV file in EXPORT_BLOCK_BYTES blocks, so it never has to fit in memory at once. """
+        if self.params is not None and params != self.params:
+            self.write(*read_wav_frames(file_path)) # Conversion needs the whole file (resampling across block edges glitches)
+            return
+        with wave.open(file_path, 'rb') as w:
+            block_frames = max(1, EXPORT_BLOCK_BYTES // (params[0] * params[1]))
+            while True:
+                frames = w.readframes(block_frames)
+                if not frames: break
+                self.write(params, frames)
+
+    def _open(self, params):
+        self.params = params
+        channels, sample_width, frame_rate = params
+        if self.output_format == 'wav':
+            self._wav = wave.open(self.output_path, 'wb')
+            self._wav.setnchannels(channels); self._wav.setsampwidth(sample_width); self._wav.setframerate(frame_rate)
+            return
+        if sample_width not in _PCM_FORMATS: raise CouldntEncodeError(f"Unsupported sample width: {sample_width} bytes")
+        command = [AudioSegment.converter, '-y', '-nostats', '-loglevel', 'error',
+                   '-f', _PCM_FORMATS[sample_width], '-ar', str(frame_rate), '-ac', str(channels), '-i', 'pipe:0',
+                   '-f', self.output_format, self.output_path]
+        # ffmpeg's messages go to a temp file so a full stderr pipe can never block our writes
+        self._ffmpeg_log = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self._ffmpeg_log)
+
+    def close(self):
+        """ Finishes the output file. Raises CouldntEncodeError if ffmpeg failed. """
+        if self._wav is not None:
+            self._wav.close(); self._wav = None
+        if self._process is not None:
+            process, self._process = self._process, None
+            try: process.stdin.close()
+            except OSError: pass # ffmpeg already exited; its return code tells why
+            process.wait()
+            self._ffmpeg_log.seek(0); ffmpeg_output = self._ffmpeg_log.read().decode('utf-8', 'replace').strip()
+            self._ffmpeg_log.close()
+            if process.returncode != 0:
+                raise CouldntEncodeError(f"ffmpeg exited with code {process.returncode}: {ffmpeg_output[-2000:]}")
+
+    def abort(self):
+        """ Stops writing and removes the incomplete output file. """
+        try: self.close()
+        except Exception: pass
+        _discard_file(self.output_path)
+
 # --- GUI Application ---
 class AudioReviewApp(tk.Tk):
     def __init__(self):
@@ -444,35 +1160,64 @@ class AudioReviewApp(tk.Tk):
         # Data storage
         self.full_audio_data = []
         self.display_audio_data = []
+        # Struct-of-arrays views of full_audio_data (built by build_columns) used for
+        # vectorized filtering/sorting. display_indices maps table rows to full_audio_data.
+        self.columns = build_columns([])
+        self.display_indices = np.empty(0, dtype=np.intp)
+        self._filter_mask = np.ones(0, dtype=bool)
+        self._sort_cache = {} # column -> ascending argsort of full_audio_data; cleared when columns change
+        self._sorted_view = (None, None) # (columns, display_indices) the last sort_column produced
+        # Treeview item ids are the entries' indices into full_audio_data as strings (short, and no path lookup table)
+        self._current_iids = () # Item ids in the Treeview, in display order (kept by populate/clear_treeview)
+        self._populated_indices = None # display_indices the Treeview currently shows; None forces a full rebuild
+        self._tree_row_limit = MAX_TREE_ROWS # Leading display_indices rows put in the Treeview; reset on filter/load
+        self._more_rows_after_id = None # Pending page load triggered by scrolling to the bottom
+        self._selected_iids = set() # Mirror of tree.selection(), refreshed on <<TreeviewSelect>> and our own changes
+        self._iid_rows = None # (item id tuple, {iid: row}) for ordering small selections; rebuilt when the tuple changes
+        self._selection_refresh_id = None # Pending idle re-read of tree.selection() after <<TreeviewSelect>>
+        self._shown_counts = None # (visible, filtered, not shown, selected) last written to the count labels
+        self._name_filter_cache = None # (columns, needle, hit indices) of the last filename filter
+        self._filter_after_id = None # Pending debounced apply_filters from typing in a filter entry
+        self._applied_filter_state = None # Parsed filter criteria of the last apply; keystrokes that don't change them don't re-filter
+        self._log_buffer = collections.deque(maxlen=LOG_MAX_LINES) # (format, args) log lines waiting for the next batched insert (appended from any thread)
+        self._log_flush_queued = False # A _schedule_log_flush is already on its way through the task queue
+        self._log_flush_id = None # Pending _flush_log
+        self._transient_dir = None # Temporary directory of the running preprocessing job (removed when it ends or the app closes)
+        self._scan_cache_memo = {} # {absolute base dir: preprocessing scan cache}, so later runs this session skip reading it from disk
 
         # State variables
         self.current_sort_column = None
         self.current_sort_reverse = False
         self.selected_directory = tk.StringVar()
         self.audio_aes_command = tk.StringVar(value='audio-aes')
-        
-        
-
-    def _parse_filter_value(self, value_str):
-        if not value_str or not value_str.strip(): return None
-        try:
-            return float(value_str)
-        except ValueError:
-            return None
         self.audio_aes_batch_size = tk.IntVar(value=10) # <<< Set safer default batch size
+        self.audio_aes_parallel_jobs = tk.IntVar(value=4) # audio-aes processes run at the same time
+        self.preprocess_combine_dirs = tk.BooleanVar(value=True) # Let each process score several directories (model loads once)
+        self.preprocess_rescan = tk.BooleanVar(value=False) # Ignore the scan cache and list every subdirectory again
         self.preprocess_overwrite = tk.BooleanVar(value=False)
 
         # Threading communication and control
         self.task_queue = queue.Queue()
         self.preprocessing_thread = None # <<< Reference to the background thread
+        self._export_thread = None # Last audio export thread (waited for before a fast exit)
         self.stop_event = threading.Event() # <<< Event to signal stop
-        self.after(100, self.process_queue)
+        self._wakeup_pending = False # A <<QueueMsg>> event is already on its way to process_queue
+        self._closing = False # Set by _on_closing; from then on background threads no longer touch Tk
+        # Queued tasks wake the main loop via a virtual event instead of fixed-interval polling
+        self.bind('<<QueueMsg>>', lambda e: self.process_queue())
+        self.after(1000, self._poll_queue_fallback)
+        threading.Thread(target=warm_up_range_mask, daemon=True).start() # Hide the first JIT compile
 
         print("DEBUG: Initializing Pygame mixer...")
         self.playback_enabled = False
+        self._sound_loader = None # Single worker that decodes Sounds off the GUI thread
+        self._sound_request = None # (path, future) of the newest decode handed to the loader
+        self._play_request = 0 # Bumped per play request; a decode that finishes after a newer request isn't played
+        self._play_future = None # Decode the newest play request waits on; a later preload never cancels it
         try:
             pygame.mixer.init()
             self.playback_enabled = True
+            self._sound_loader = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             print("Pygame mixer initialized successfully.")
         except pygame.error as e:
             messagebox.showwarning("Playback Warning", f"Could not initialize audio playback: {e}\nPlayback will be disabled.")
@@ -486,45 +1231,122 @@ class AudioReviewApp(tk.Tk):
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
         print("DEBUG: Finished AudioReviewApp.__init__")
 
+    def _parse_filter_value(self, value_str):
+        if not value_str or not value_str.strip(): return None
+        try:
+            return float(value_str)
+        except ValueError:
+            return None
+
+    def _enqueue(self, func, args=()):
+        """
+        Queues func(*args) for the GUI thread and wakes the main loop (safe from any thread).
+        Only the first task after a drain generates the wake-up event; the rest ride along with it.
+        Dropped once the window is closing: without a main loop each cross-thread Tk call stalls ~1s before failing.
+        """
+        if self._closing: return
+        self.task_queue.put((func, args))
+        if self._wakeup_pending: return
+        self._wakeup_pending = True
+        try:
+            self.event_generate('<<QueueMsg>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            self._wakeup_pending = False # Window closing or main loop not running; the fallback poll drains it
 
     def process_queue(self):
-        """ Process tasks from the background thread queue to update GUI safely. """
+        """
+        Process tasks from the background thread queue to update GUI safely.
+        Status bar updates are coalesced: only the newest one in each drained batch is applied.
+        """
+        self._wakeup_pending = False # Cleared before draining, so anything queued from now on wakes us again
+        tasks = []
         try:
             while True:
-                task = self.task_queue.get_nowait()
-                if task:
-                    func, args = task
-                    func(*args)
+                tasks.append(self.task_queue.get_nowait())
                 self.task_queue.task_done()
         except queue.Empty:
             pass
-        finally:
-            self.after(100, self.process_queue)
+        status_config = self.status_label.config
+        last_status = None
+        for i, task in enumerate(tasks):
+            if task and task[0] == status_config: last_status = i
+        for i, task in enumerate(tasks):
+            if not task: continue
+            func, args = task
+            if func == status_config and i != last_status: continue # Superseded status text
+            func(*args)
+
+    def _poll_queue_fallback(self):
+        """ Slow safety net in case a wake-up event was lost. """
+        self.process_queue()
+        self.after(1000, self._poll_queue_fallback)
+
+    def _call_soon(self, callback):
+        """ Runs callback (e.g. a dialog) on the GUI thread, from any thread; dropped if the window is closing or closed. """
+        if self._closing: return
+        try: self.after(0, callback)
+        except (tk.TclError, RuntimeError): pass # Window closed; the exit only waits for this thread to finish
 
     def _update_status(self, message):
         """ Safely update status bar text from any thread via the queue. """
-        self.task_queue.put((self.status_label.config, ({'text': f"Status: {message}"},)))
+        self._enqueue(self.status_label.config, ({'text': f"Status: {message}"},))
         print(f"Status Update: {message}")
 
-    def _append_log(self, message):
-        """ Safely append message to the log ScrolledText widget from any thread. """
+    def _show_status_now(self, message):
+        """
+        Shows a status before long work on the GUI thread (it blocks the event loop, so a queued
+        update would only appear afterwards). Must run in the main GUI thread.
+        """
+        self.status_label.config(text=f"Status: {message}"); print(f"Status Update: {message}")
+        self.update_idletasks() # Redraw now; the queue isn't drained until the work returns
+
+    def _append_log(self, message, *args):
+        """
+        Safely append message to the log ScrolledText widget from any thread. With args, message is a
+        str.format template that is only filled in when the line is rendered on the GUI thread.
+        Lines go straight into a shared buffer; only the first one after a flush goes through the task queue.
+        """
+        if self._closing: return # Nobody will see it; see _enqueue
         if hasattr(self, 'log_text') and self.log_text:
-            self.task_queue.put((self._do_append_log, (message,)))
-
-    def _do_append_log(self, message):
-         """ Actual log update method (must run in main GUI thread). """
-         try:
-             self.log_text.config(state=tk.NORMAL)
-             self.log_text.insert(tk.END, message + '\n')
-             self.log_text.see(tk.END)
-             self.log_text.config(state=tk.DISABLED)
-         except tk.TclError as e:
-              print(f"Error appending to log (widget might be destroyed): {e}")
+            self._log_buffer.append((message, args)) # deque.append is atomic
+            if self._log_flush_queued: return
+            self._log_flush_queued = True
+            self._enqueue(self._schedule_log_flush)
+
+    def _schedule_log_flush(self):
+        """
+        Arms the batched log insert (must run in main GUI thread). Lines arriving in bursts (e.g. streamed
+        audio-aes stderr, per-file export lines) reach the widget in one insert every LOG_FLUSH_MS.
+        """
+        if self._log_flush_id is None:
+            self._log_flush_id = self.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """ Formats all buffered log lines and inserts them with a single Text.insert. """
+        self._log_flush_id = None
+        self._log_flush_queued = False # Cleared before draining, so any line appended from now on schedules a flush
+        buffer = self._log_buffer; lines = []
+        try:
+            while True:
+                message, args = buffer.popleft()
+                lines.append(message.format(*args) if args else message)
+        except IndexError:
+            pass
+        if not lines: return
+        try:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, '\n'.join(lines) + '\n')
+            excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - LOG_MAX_LINES
+            if excess > 0: self.log_text.delete('1.0', f'{excess + 1}.0') # Trim the oldest lines
+            self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+        except tk.TclError as e:
+            print(f"Error appending to log (widget might be destroyed): {e}")
 
     def _update_preprocess_status(self, current, total, message):
         """ Specific status update for preprocessing progress. """
         status_text = f"Status: {message}"
-        self.task_queue.put((self.status_label.config, ({'text': status_text},)))
+        self._enqueue(self.status_label.config, ({'text': status_text},))
 
     def _create_widgets(self):
         # --- Top Frame: Directory Selection & Preprocessing ---
@@ -582,6 +1404,8 @@ class AudioReviewApp(tk.Tk):
         filter_button_frame = ttk.Frame(filter_frame); filter_button_frame.grid(row=3, column=6, columnspan=4, pady=5, sticky="e")
         filter_button = ttk.Button(filter_button_frame, text="Apply Filters", command=self.apply_filters); filter_button.pack(side=tk.LEFT, padx=(15, 5))
         clear_filter_button = ttk.Button(filter_button_frame, text="Clear Filters", command=self.clear_filters); clear_filter_button.pack(side=tk.LEFT, padx=5)
+        # Live filtering: typing in a filter entry re-applies once the user pauses
+        for filter_entry in self._filter_entries(): filter_entry.bind('<KeyRelease>', self._schedule_apply)
 
         # --- Middle Frame: Treeview (Data Table) ---
         tree_frame = ttk.Frame(self, padding=(10, 0, 10, 0))
@@ -607,8 +1431,11 @@ class AudioReviewApp(tk.Tk):
         self.tree.column('Path', anchor=tk.W, width=300, stretch=tk.YES)
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        vsb.pack(side=tk.RIGHT, fill=tk.Y); hsb.pack(side=tk.BOTTOM, fill=tk.X); self.tree.pack(expand=True, fill=tk.BOTH)
+        # Vertical scrolling goes through a proxy that also loads the next page near the bottom
+        self._tree_vsb_set = vsb.set
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=hsb.set)
+        self._tree_pack_options = {'expand': True, 'fill': tk.BOTH} # Reused when re-packing after bulk inserts
+        vsb.pack(side=tk.RIGHT, fill=tk.Y); hsb.pack(side=tk.BOTTOM, fill=tk.X); self.tree.pack(**self._tree_pack_options)
         self.tree.bind('<Double-1>', self.play_selected); self.tree.bind('<<TreeviewSelect>>', self.update_selection_count)
 
         # --- Action Frame (Below Treeview) ---
@@ -619,6 +1446,7 @@ class AudioReviewApp(tk.Tk):
         export_audio_button = ttk.Button(action_frame, text="Export Selected Audio...", command=self.export_selected_audio); export_audio_button.pack(side=tk.LEFT, padx=5)
         export_list_button = ttk.Button(action_frame, text="Export Selected File List...", command=self.export_selected_list); export_list_button.pack(side=tk.LEFT, padx=5)
         self.visible_count_label = ttk.Label(action_frame, text="Visible: 0"); self.visible_count_label.pack(side=tk.RIGHT, padx=10)
+        self.show_more_button = ttk.Button(action_frame, text="Show More", command=self.show_more_rows, state=tk.DISABLED); self.show_more_button.pack(side=tk.RIGHT, padx=5)
         self.selected_count_label = ttk.Label(action_frame, text="Selected: 0"); self.selected_count_label.pack(side=tk.RIGHT, padx=10)
 
         # --- Log Frame ---
@@ -635,9 +1463,9 @@ class AudioReviewApp(tk.Tk):
         directory = filedialog.askdirectory(title="Select Main Dataset Directory (Containing Subdirs)")
         if directory:
             self.selected_directory.set(directory)
+            _get_sound.cache_clear()
             self._update_status(f"Selected directory: {directory}. Click 'Load Data' or 'Preprocess Options...'.")
-            self.full_audio_data = []
-            self.display_audio_data = []
+            self._set_full_audio_data([])
             self.clear_treeview()
             self.update_counts()
 
@@ -649,17 +1477,15 @@ class AudioReviewApp(tk.Tk):
             return
 
         self._update_status("Loading data...")
-        self.update_idletasks()
 
-        self.full_audio_data = []
-        self.display_audio_data = []
+        self._set_full_audio_data([])
         self.clear_treeview()
         self.update_counts()
 
-        start_time = time.time()
+        start_time = time.monotonic()
         try:
             loaded_data, error_msg, subdir_count = load_audio_data(directory, self.search_subdirs.get(), self._update_status)
-            load_time = time.time() - start_time
+            load_time = time.monotonic() - start_time
 
             if loaded_data and len(loaded_data) > 100000:
                 messagebox.showwarning("Large Dataset Loaded",
@@ -675,14 +1501,14 @@ class AudioReviewApp(tk.Tk):
                 messagebox.showinfo("No Data", f"No audio data found or loaded from the {subdir_count} scanned subdirectories.")
                 self._update_status(f"Scanned {subdir_count} subdirs. No data loaded. Load time: {load_time:.2f}s")
             else:
-                self.full_audio_data = loaded_data
+                self._set_full_audio_data(loaded_data)
                 self.apply_filters()
                 self._update_status(f"Loaded {len(self.full_audio_data)} files from {subdir_count} subdirs. Load time: {load_time:.2f}s. Use filters for large datasets.")
         except Exception as e:
-            load_time = time.time() - start_time
+            load_time = time.monotonic() - start_time
             self._update_status(f"Critical error during loading after {load_time:.2f}s.")
-            messagebox.showerror("Loading Failed", f"An unexpected error occurred during data loading:\n{e}\n\n{traceback.format_exc()}")
-            print(f"CRITICAL LOADING ERROR: {e}\n{traceback.format_exc()}")
+            messagebox.showerror("Loading Failed", f"An unexpected error occurred during data loading:\n{e}{traceback_text(2)}")
+            print(f"CRITICAL LOADING ERROR: {e}{traceback_text()}")
 
     def analyze_features(self):
         """
@@ -693,7 +1519,6 @@ class AudioReviewApp(tk.Tk):
             messagebox.showinfo("No Data", "No data loaded or visible. Please load and filter data first.", parent=self)
             return
 
-        self._update_status("Analyzing audio features...")
         energy_threshold_str = self.mid_word_energy_threshold.get()
         zcr_threshold_str = self.mid_word_zcr_threshold.get()
 
@@ -714,12 +1539,15 @@ class AudioReviewApp(tk.Tk):
                 return
         else:
             zcr_threshold = 0.1
-        self.update_idletasks()  # Force GUI update
+        self._show_status_now("Analyzing audio features...")
 
-        analysis_start_time = time.time()
+        analysis_start_time = time.monotonic()
         try:
-            self.display_audio_data = add_audio_features(self.display_audio_data)
-            analysis_time = time.time() - analysis_start_time
+            # Entries are shared with full_audio_data, so refresh the column arrays too
+            add_audio_features(self.display_audio_data)
+            self.columns = build_columns(self.full_audio_data); self._sort_cache = {}
+            self._populated_indices = None # Row values changed; rebuild even though the rows are the same
+            analysis_time = time.monotonic() - analysis_start_time
             self.populate_treeview() # Refresh the treeview to show new data
             self._update_status(f"Audio feature analysis completed in {analysis_time:.2f} seconds.  Data updated.")
             self._append_log("Analysis done on filtered files")
@@ -731,58 +1559,102 @@ class AudioReviewApp(tk.Tk):
 
         except Exception as e:
             self._update_status("Error during audio feature analysis.")
-            messagebox.showerror("Analysis Error", f"An error occurred during analysis: {e}\n{traceback.format_exc()}", parent=self)
-            print(f"ANALYSIS ERROR: {e}\n{traceback.format_exc()}")
-
-    def apply_filters(self):
-        """ Filters self.full_audio_data into self.display_audio_data based on GUI filter criteria and updates Treeview. """
-        self._update_status("Applying filters...")
-        self.update_idletasks()
-
-        filter_filename_str = self.filter_filename.get().lower().strip()
-        pq_min = self._parse_filter_value(self.filter_pq_min.get()); pq_max = self._parse_filter_value(self.filter_pq_max.get()) 
-        ce_min = self._parse_filter_value(self.filter_ce_min.get()); ce_max = self._parse_filter_value(self.filter_ce_max.get()) 
-        cu_min = self._parse_filter_value(self.filter_cu_min.get()); cu_max = self._parse_filter_value(self.filter_cu_max.get()) 
-        pc_min = self._parse_filter_value(self.filter_pc_min.get()); pc_max = self._parse_filter_value(self.filter_pc_max.get()) 
-        length_min = self._parse_filter_value(self.filter_length_min.get()); length_max = self._parse_filter_value(self.filter_length_max.get()) 
-        starts_mid_word_filter = self.filter_mid_word_start_var.get()
-        ends_mid_word_filter = self.filter_mid_word_end_var.get()
-        
-        if pq_min is not None and pq_max is not None and pq_min > pq_max: messagebox.showwarning("Filter Warning", "PQ min value is greater than max value.", parent=self); return
-        if ce_min is not None and ce_max is not None and ce_min > ce_max: messagebox.showwarning("Filter Warning", "CE min value is greater than max value.", parent=self); return
-        if cu_min is not None and cu_max is not None and cu_min > cu_max: messagebox.showwarning("Filter Warning", "CU min value is greater than max value.", parent=self); return
-        if pc_min is not None and pc_max is not None and pc_min > pc_max: messagebox.showwarning("Filter Warning", "PC min value is greater than max value.", parent=self); return
+            messagebox.showerror("Analysis Error", f"An error occurred during analysis: {e}{traceback_text()}", parent=self)
+            print(f"ANALYSIS ERROR: {e}{traceback_text()}")
+
+    def _filter_entries(self):
+        """ The filter Entry widgets, in GUI order. """
+        return (self.filter_filename, self.filter_pq_min, self.filter_pq_max, self.filter_ce_min, self.filter_ce_max,
+                self.filter_cu_min, self.filter_cu_max, self.filter_pc_min, self.filter_pc_max, self.filter_length_min, self.filter_length_max)
+
+    def _filter_state(self):
+        """ Current filter inputs (entry texts, then the mid-word flags), read from the widgets in one pass. """
+        return tuple(e.get() for e in self._filter_entries()) + (self.filter_mid_word_start_var.get(), self.filter_mid_word_end_var.get())
+
+    def _schedule_apply(self, event=None):
+        """ Debounces live filtering: each keystroke restarts the timer so only the final input is applied. """
+        if self._filter_after_id: self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(FILTER_DEBOUNCE_MS, lambda: self.apply_filters(live=True))
 
-        filter_start_time = time.time()
-        filtered_data = []
+    def apply_filters(self, live=False):
+        """
+        Filters self.full_audio_data into self.display_audio_data based on GUI filter criteria and updates Treeview.
+        live=True (debounced typing) skips inputs that don't change the result (e.g. '5' -> '5.0') and
+        half-typed numbers, and reports min/max conflicts in the status bar instead of a dialog.
+        """
+        if self._filter_after_id: self.after_cancel(self._filter_after_id); self._filter_after_id = None
+        # Every widget is read once by _filter_state(); unpack those values instead of asking Tk again
+        filename_text, *bound_texts, starts_mid_word_filter, ends_mid_word_filter = self._filter_state()
+        filter_filename_str = filename_text.lower().strip()
+        # (min, max) per numeric column, in _filter_entries() order
+        bounds = {key: (self._parse_filter_value(bound_texts[2 * i]), self._parse_filter_value(bound_texts[2 * i + 1]))
+                  for i, key in enumerate(('PQ', 'CE', 'CU', 'PC', 'audio_length_seconds'))}
+        filter_state = (filter_filename_str, tuple(bounds.values()), starts_mid_word_filter, ends_mid_word_filter)
+        if live:
+            if filter_state == self._applied_filter_state: return
+            # Mid-edit text like '-' or '5e' would otherwise drop that bound and re-show everything for a moment
+            if any(text.strip() and self._parse_filter_value(text) is None for text in bound_texts):
+                self._update_status("Filter not applied: a min/max field is not a number yet."); return
+        # Live filtering runs on every keystroke; a forced redraw there only adds latency
+        if live: self._update_status("Applying filters...")
+        else: self._show_status_now("Applying filters...")
+
+        for key in ('PQ', 'CE', 'CU', 'PC'):
+            lo, hi = bounds[key]
+            if lo is not None and hi is not None and lo > hi:
+                if live: self._update_status(f"Filter not applied: {key} min value is greater than max value.")
+                else: messagebox.showwarning("Filter Warning", f"{key} min value is greater than max value.", parent=self)
+                return
+        self._applied_filter_state = filter_state
+
+        filter_start_time = time.monotonic()
         try:
-            for entry in self.full_audio_data:
-                if filter_filename_str and filter_filename_str not in entry['filename'].lower(): continue
-                if pq_min is not None and (entry['PQ'] is None or entry['PQ'] < pq_min): continue
-                if pq_max is not None and (entry['PQ'] is None or entry['PQ'] > pq_max): continue
-                if ce_min is not None and (entry['CE'] is None or entry['CE'] < ce_min): continue
-                if ce_max is not None and (entry['CE'] is None or entry['CE'] > ce_max): continue
-                if cu_min is not None and (entry['CU'] is None or entry['CU'] < cu_min): continue
-                if cu_max is not None and (entry['CU'] is None or entry['CU'] > cu_max): continue
-                if pc_min is not None and (entry['PC'] is None or entry['PC'] < pc_min): continue
-                if pc_max is not None and (entry['PC'] is None or entry['PC'] > pc_max): continue
-                if length_min is not None and (entry['audio_length_seconds'] is None or entry['audio_length_seconds'] < length_min): continue
-                if length_max is not None and (entry['audio_length_seconds'] is None or entry['audio_length_seconds'] > length_max): continue
-                if starts_mid_word_filter and not entry['starts_mid_word']: continue
-                filtered_data.append(entry)
-
-            self.display_audio_data = filtered_data
-            filter_time = time.time() - filter_start_time
+            cols = self.columns
+            mask = self._filter_mask; mask.fill(True) # Reused across filter passes
+            if filter_filename_str:
+                name_mask = np.zeros_like(mask); name_mask[self._filename_hits(filter_filename_str)] = True
+                mask &= name_mask
+            # Bounds per numeric row (NaN = unset). Missing values (NaN) never pass an active bound.
+            lows = np.full(len(NUMERIC_COLUMNS), np.nan, dtype=np.float32); highs = lows.copy()
+            for row, key in enumerate(NUMERIC_COLUMNS):
+                lo, hi = bounds[key]
+                if lo is not None: lows[row] = lo
+                if hi is not None: highs[row] = hi
+            range_mask(cols['numeric'], lows, highs, mask) # No-op when no bound is set
+            if starts_mid_word_filter: mask &= cols['starts_mid_word']
+            if ends_mid_word_filter: mask &= cols['ends_mid_word']
+
+            self._set_display_indices(np.flatnonzero(mask))
+            filter_time = time.monotonic() - filter_start_time
             print(f"Filtering took {filter_time:.3f}s")
 
             self.current_sort_column = None; self.current_sort_reverse = False
+            self._tree_row_limit = MAX_TREE_ROWS
             self.populate_treeview()
             self._update_status(f"Filters applied. Displaying {len(self.display_audio_data)} out of {len(self.full_audio_data)} files.")
 
         except Exception as e:
             self._update_status("Error applying filters.")
-            messagebox.showerror("Filter Error", f"An unexpected error occurred during filtering:\n{e}\n\n{traceback.format_exc()}")
-            print(f"FILTERING ERROR: {e}\n{traceback.format_exc()}")
+            messagebox.showerror("Filter Error", f"An unexpected error occurred during filtering:\n{e}{traceback_text(2)}")
+            print(f"FILTERING ERROR: {e}{traceback_text()}")
+
+    def _filename_hits(self, needle):
+        """
+        Indices of entries whose lowercased filename contains needle. Re-applying the same text
+        reuses the last result; extending it (typing more characters) only re-checks the last hits.
+        """
+        cols = self.columns; cached = self._name_filter_cache
+        if cached is not None and cached[0] is cols:
+            _, prev_needle, prev_hits = cached
+            if needle == prev_needle: return prev_hits
+            if prev_needle in needle and len(prev_hits) * 16 < len(self.full_audio_data):
+                names_lower = cols['name_lower']
+                hits = np.array([i for i in prev_hits.tolist() if needle in names_lower[i]], dtype=np.intp)
+                self._name_filter_cache = (cols, needle, hits)
+                return hits
+        hits = filename_match_indices(cols, needle)
+        self._name_filter_cache = (cols, needle, hits)
+        return hits
 
     def clear_filters(self):
         """ Clears filter entry fields and reapplies (showing all data or respecting previous full load). """
@@ -798,124 +1670,311 @@ class AudioReviewApp(tk.Tk):
 
     def clear_treeview(self):
         """ Removes all items from the Treeview widget. """
-        if self.tree.get_children():
+        children = self._current_iids
+        self._current_iids = (); self._populated_indices = None
+        self._selected_iids = set() # Deleted items drop out of the selection
+        if children:
             try:
-                self.tree.delete(*self.tree.get_children())
+                self.tree.delete(*children)
             except tk.TclError as e:
                  print(f"Ignoring error during Treeview clear (possibly already destroyed): {e}")
 
 
     def populate_treeview(self):
-        """ Populates the treeview with data from self.display_audio_data. """
+        """
+        Populates the treeview with data from self.display_audio_data, up to the first
+        _tree_row_limit rows (Tk's Treeview isn't built for 100k+ items; scrolling to the bottom
+        or 'Show More' pages on). Skips the rebuild when the shown rows didn't change, and only
+        moves/patches the existing items when most of them stay (e.g. after a sort).
+        """
+        if self._more_rows_after_id: self.after_cancel(self._more_rows_after_id); self._more_rows_after_id = None
+        indices = self.display_indices[:self._tree_row_limit]; shown = self._populated_indices
+        if shown is not None and len(shown) == len(self._current_iids):
+            if len(shown) == len(indices) and np.array_equal(shown, indices): self.update_counts(); return
+            was_shown = np.zeros(len(self.full_audio_data), dtype=bool); was_shown[shown] = True
+            kept = np.count_nonzero(was_shown[indices])
+            # Moving an item is much cheaper than re-creating it; below half reuse a clean rebuild wins
+            if kept and kept * 2 >= len(indices): self._reorder_treeview(indices, was_shown); return
         self.clear_treeview()
-        insert_start_time = time.time()
+        insert_start_time = time.monotonic()
         try:
-            items_to_insert = []
-            for entry in self.display_audio_data:
-                ce_val = f"{entry['CE']:.4f}" if entry['CE'] is not None else "N/A"
-                cu_val = f"{entry['CU']:.4f}" if entry['CU'] is not None else "N/A"
-                pc_val = f"{entry['PC']:.4f}" if entry['PC'] is not None else "N/A"
-                pq_val = f"{entry['PQ']:.4f}" if entry['PQ'] is not None else "N/A"
-                starts_mid_word = "Yes" if entry.get("starts_mid_word",False) else "No"  # Use get() with default
-                ends_mid_word = "Yes" if entry.get("ends_mid_word",False) else "No"      # to handle missing keys
-                length = entry.get("audio_length_seconds", 0) # Default to 0 if not yet analyzed
-                items_to_insert.append(
-                    ('', tk.END, entry['path'], {'values': (entry['filename'], ce_val, cu_val, pc_val, pq_val, starts_mid_word, ends_mid_word, length, entry['path'])})
-                 )
-
-            for parent, index, iid, options in items_to_insert:
-                 try:
-                     self.tree.insert(parent, index, iid=iid, **options)
-                 except tk.TclError as e:
-                     # Handle cases where an item might already exist if logic allows duplicates (it shouldn't with path as iid)
-                     print(f"Warning: Could not insert item with iid '{iid}' into Treeview: {e}")
-                     continue # Skip this item
-
-            insert_time = time.time() - insert_start_time
-            print(f"Populating Treeview with {len(self.display_audio_data)} items took {insert_time:.3f}s")
+            tree = self.tree
+            # Unmap the tree and hide all columns while bulk inserting so Tk doesn't lay out/redraw per row
+            tree.pack_forget(); tree.configure(displaycolumns=())
+            try:
+                self._current_iids = self._insert_rows_at_front(indices); self._populated_indices = indices
+            finally:
+                tree.configure(displaycolumns='#all'); tree.pack(**self._tree_pack_options)
+
+            insert_time = time.monotonic() - insert_start_time
+            print(f"Populating Treeview with {len(indices)} of {len(self.display_audio_data)} items took {insert_time:.3f}s")
             if insert_time > 2.0:
                  print("Warning: Treeview population is slow. Consider applying stricter filters.")
                  self._update_status(f"Displaying {len(self.display_audio_data)} items (Warning: Render may be slow).")
 
         except Exception as e:
              self._update_status("Error populating table.")
-             messagebox.showerror("Display Error", f"An error occurred displaying the data:\n{e}\n\n{traceback.format_exc()}")
-             print(f"POPULATE TREEVIEW ERROR: {e}\n{traceback.format_exc()}")
+             messagebox.showerror("Display Error", f"An error occurred displaying the data:\n{e}{traceback_text(2)}")
+             print(f"POPULATE TREEVIEW ERROR: {e}{traceback_text()}")
         finally:
             self.update_counts()
 
+    def _insert_rows_at_front(self, indices):
+        """
+        Inserts the rows of indices (in order) before the Treeview's current items. They go in back
+        to front at index 0, which is the cheap end to insert at. Returns the inserted iids in order.
+        """
+        tree = self.tree
+        # The Tcl command is called directly: ttk's insert() wrapper re-formats the option dict on every row
+        call = tree.tk.call; widget = str(tree)
+        inserted = []; add_inserted = inserted.append # Hoisted out of the loop
+        backwards = indices[::-1]
+        for iid, entry in zip(map(str, backwards.tolist()), self.columns['entry'][backwards].tolist()): # Gathered in C, not indexed per row
+            try:
+                call(widget, 'insert', '', 0, '-id', iid, '-values', entry.row_values())
+                add_inserted(iid)
+            except tk.TclError as e:
+                # Handle cases where an item might already exist if logic allows duplicates (it shouldn't with the index as iid)
+                print(f"Warning: Could not insert item with iid '{iid}' ({entry.path}) into Treeview: {e}")
+                continue # Skip this item
+        inserted.reverse()
+        return tuple(inserted)
+
+    def _reorder_treeview(self, indices, was_shown):
+        """
+        Turns the Treeview's items into the rows of indices, in that order. Items that stay are moved
+        (keeping their selection), the rest deleted in one call, and rows not shown yet inserted.
+        was_shown is the full_audio_data mask of the rows currently in the tree.
+        """
+        iids = tuple(map(str, indices.tolist()))
+        wanted = np.zeros(len(was_shown), dtype=bool); wanted[indices] = True
+        shown = self._populated_indices
+        gone = tuple(map(str, shown[~wanted[shown]].tolist()))
+        tree = self.tree
+        tree.pack_forget()
+        try:
+            if gone:
+                tree.delete(*gone); self._selected_iids.difference_update(gone) # Deleted items drop out of the selection
+            # Like the bulk insert: moving/inserting each item at the front, last one first, never makes Tk
+            # walk the child list to a numeric position (which would make a reorder quadratic)
+            call = tree.tk.call; widget = str(tree); entries = self.columns['entry']
+            backwards = indices[::-1]
+            for idx, iid, present in zip(backwards.tolist(), reversed(iids), was_shown[backwards].tolist()):
+                if present: call(widget, 'move', iid, '', 0)
+                else: call(widget, 'insert', '', 0, '-id', iid, '-values', entries[idx].row_values())
+            self._current_iids = iids; self._populated_indices = indices
+        except tk.TclError as e:
+            print(f"Warning: Could not reorder Treeview items, rebuilding: {e}")
+            self._populated_indices = None; self._current_iids = tree.get_children() # Whatever is in the tree now gets cleared
+        finally:
+            tree.pack(**self._tree_pack_options)
+        if self._populated_indices is None: self.populate_treeview()
+        else: self.update_counts()
+
+    def _rows_not_shown(self):
+        """ Number of filtered rows not yet put into the Treeview. """
+        return len(self.display_indices) - (len(self._populated_indices) if self._populated_indices is not None else 0)
+
+    def _on_tree_yscroll(self, first, last):
+        """ yscrollcommand proxy: updates the scrollbar and loads the next page once the last rows come into view. """
+        self._tree_vsb_set(first, last)
+        if float(last) >= 0.98 and not self._more_rows_after_id and self._rows_not_shown() > 0:
+            self._more_rows_after_id = self.after_idle(self.show_more_rows)
+
+    def show_more_rows(self):
+        """ Adds the next MAX_TREE_ROWS filtered rows below the Treeview's rows, keeping scroll position and selection. """
+        self._more_rows_after_id = None
+        shown = self._populated_indices
+        if shown is None or len(shown) != len(self._current_iids): # Nothing shown yet, or rows were skipped: rebuild
+            self._tree_row_limit += MAX_TREE_ROWS; self.populate_treeview(); return
+        new_rows = self.display_indices[len(shown):len(shown) + MAX_TREE_ROWS]
+        if not len(new_rows): return
+        append_start_time = time.monotonic()
+        self._tree_row_limit = len(shown) + len(new_rows)
+        try:
+            # Appending at 'end' makes Tk walk the whole child list per insert; instead put the new page
+            # in front, then move the existing rows back in front of it, both at constant cost per item
+            added = self._insert_rows_at_front(new_rows)
+            call = self.tree.tk.call; widget = str(self.tree)
+            for iid in reversed(self._current_iids): call(widget, 'move', iid, '', 0)
+        except tk.TclError as e:
+            print(f"Warning: Could not append rows to Treeview, rebuilding: {e}")
+            self._populated_indices = None; self.populate_treeview(); return
+        self._current_iids += added; self._populated_indices = self.display_indices[:self._tree_row_limit]
+        print(f"Added {len(added)} rows to the Treeview in {time.monotonic() - append_start_time:.3f}s")
+        self.update_counts()
+
+    def _set_full_audio_data(self, audio_data):
+        """ Replaces the loaded data, rebuilding the column arrays and resetting the view. """
+        self.full_audio_data = audio_data
+        self.columns = build_columns(audio_data); self._sort_cache = {}; self._populated_indices = None; self._applied_filter_state = None
+        self._tree_row_limit = MAX_TREE_ROWS
+        self._filter_mask = np.ones(len(audio_data), dtype=bool)
+        self._set_display_indices(np.arange(len(audio_data), dtype=np.intp))
+
+    def _set_display_indices(self, indices):
+        """ Sets the displayed rows (indices into full_audio_data, in display order). """
+        self.display_indices = indices
+        self.display_audio_data = self.columns['entry'][indices].tolist() # Gathered in C, not a Python loop
+
     def get_entry_by_iid(self, iid):
-        """ Finds the original data dictionary from self.full_audio_data using the Treeview item ID (path). """
-        for entry in self.full_audio_data:
-            if entry['path'] == iid: return entry
-        return None
+        """ Finds the original AudioEntry from self.full_audio_data using the Treeview item ID (its index). """
+        try:
+            index = int(iid)
+        except (TypeError, ValueError):
+            return None
+        return self.full_audio_data[index] if 0 <= index < len(self.full_audio_data) else None
 
     def sort_column(self, col_key, is_numeric=False):
         """ Sorts the *displayed* data (self.display_audio_data) and repopulates the treeview. """
         if not self.display_audio_data: self._update_status("Nothing to sort."); return
 
-        self._update_status(f"Sorting by {col_key}...")
-        self.update_idletasks()
+        self._show_status_now(f"Sorting by {col_key}...")
 
         reverse = False
         if self.current_sort_column == col_key: reverse = not self.current_sort_reverse
         else: reverse = False
 
-        def sort_key(item):
-            val = item.get(col_key)
-            if val is None: return float('inf') if not reverse else float('-inf')
-            if is_numeric:
-                try: return float(val)
-                except (ValueError, TypeError): return float('inf') if not reverse else float('-inf')
-            return str(val).lower()
-
-        sort_start_time = time.time()
+        sort_start_time = time.monotonic()
         try:
-            self.display_audio_data.sort(key=sort_key, reverse=reverse)
+            indices = self.display_indices
+            values = self.columns.get(col_key) # None for 'path': its keys are built from the entries below
+            full_order = self._sort_cache.get(col_key)
+            sorted_columns, sorted_indices = self._sorted_view
+            flip = self.current_sort_column == col_key and sorted_columns is self.columns and sorted_indices is indices
+            if flip:
+                # Same column clicked again on the view it just sorted: only the direction changes
+                ordered = indices; full_order = None
+            elif (values is not None and values.dtype == bool) or (is_numeric and full_order is None and len(indices) * 16 < len(self.full_audio_data)):
+                # Flags ("No" before "Yes", a linear radix sort) and small views of numeric columns (NaN last)
+                # sort just the displayed values; ties keep the current display order
+                ordered = indices[np.argsort(values[indices], kind='stable')]
+            elif full_order is None:
+                # Sorted once over the full dataset; later clicks only narrow it to the displayed rows
+                if is_numeric: full_order = np.argsort(values, kind='stable') # NaN (missing) sorts last
+                else:
+                    # Keys computed once per column (filenames reuse the lowercased filter names), then
+                    # a decorate-sort over indices so no key function runs per comparison
+                    if col_key == 'filename': keys = self.columns['name_lower']
+                    elif col_key == 'path': keys = [e.path.lower() for e in self.full_audio_data]
+                    else: keys = [str(v).lower() for v in values]
+                    full_order = np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype=np.intp)
+                self._sort_cache[col_key] = full_order
+            if full_order is not None:
+                shown = np.zeros(len(self.full_audio_data), dtype=bool); shown[indices] = True
+                ordered = full_order[shown[full_order]] # Boolean indexing keeps the sorted order
+            if reverse or flip: # Ascending order, or the current order to turn around
+                if is_numeric:
+                    # Keep missing values last when descending too
+                    valid = len(ordered) - np.count_nonzero(np.isnan(values[indices]))
+                    ordered = np.concatenate((ordered[:valid][::-1], ordered[valid:]))
+                else: ordered = ordered[::-1]
+            self._set_display_indices(ordered); self._sorted_view = (self.columns, ordered)
             self.current_sort_column = col_key
             self.current_sort_reverse = reverse
-            sort_time = time.time() - sort_start_time
+            sort_time = time.monotonic() - sort_start_time
             print(f"Sorting {len(self.display_audio_data)} items took {sort_time:.3f}s")
 
             self.populate_treeview()
             self._update_status(f"Sorted by {col_key} {'descending' if reverse else 'ascending'}.")
         except Exception as e:
             self._update_status("Error during sorting.")
-            messagebox.showerror("Sort Error", f"Could not sort column '{col_key}': {e}\n\n{traceback.format_exc()}")
-            print(f"SORTING ERROR: {e}\n{traceback.format_exc()}")
+            messagebox.showerror("Sort Error", f"Could not sort column '{col_key}': {e}{traceback_text(2)}")
+            print(f"SORTING ERROR: {e}{traceback_text()}")
 
 
     def update_counts(self):
-        """ Updates the visible and selected count labels at the bottom. """
+        """ Updates the visible and selected count labels at the bottom (only touching Tk when a value changed). """
         try:
-            visible_count = len(self.tree.get_children())
-            selected_count = len(self.tree.selection())
-            self.visible_count_label.config(text=f"Visible: {visible_count}")
+            visible_count = len(self._current_iids)
+            selected_count = len(self._selected_iids)
+            not_shown = self._rows_not_shown()
+            counts = (visible_count, len(self.display_indices), not_shown, selected_count)
+            if counts == self._shown_counts: return
+            self._shown_counts = counts
+            self.visible_count_label.config(text=f"Visible: {visible_count} of {len(self.display_indices)}" if not_shown > 0 else f"Visible: {visible_count}")
+            self.show_more_button.config(state=tk.NORMAL if not_shown > 0 else tk.DISABLED)
             self.selected_count_label.config(text=f"Selected: {selected_count}")
         except tk.TclError:
              pass # Ignore errors if widgets are being destroyed
 
     def update_selection_count(self, event=None):
-         """ Callback for Treeview selection change event. """
+         """
+         Callback for Treeview selection change event. A burst of events (each chunked selection_add
+         of Select All queues one) is coalesced into a single read of tree.selection() at idle time.
+         """
+         if self._selection_refresh_id is None: self._selection_refresh_id = self.after_idle(self._refresh_selection)
+
+    def _refresh_selection(self):
+         """ Re-reads the selection from Tk (the one place it is read back) and updates the counts. """
+         self._selection_refresh_id = None
+         self._selected_iids = set(self.tree.selection())
          self.update_counts()
+         if len(self._selected_iids) == 1 and self._sound_loader:
+             # Decode the clip in the background now, so a following Play/double-click starts at once
+             entry = self.get_entry_by_iid(next(iter(self._selected_iids)))
+             if entry: self._load_sound(entry.path) # Errors are reported when it is played
+
+    def _load_sound(self, path):
+        """
+        Returns a future for the decoded Sound of path (must run in main GUI thread). Only the newest request is
+        kept: a still-queued decode of another clip is cancelled, so after arrowing through rows (or pressing Play)
+        at most the one decode already running is waited for. A pending or finished load of the same path is reused,
+        and the decode a pending Play waits on is never cancelled.
+        """
+        if self._sound_request is not None:
+            pending_path, future = self._sound_request
+            if pending_path == path and not future.cancelled() and not (future.done() and future.exception() is not None):
+                return future
+            if future is not self._play_future: future.cancel() # No effect once it is running or done
+        future = self._sound_loader.submit(_get_sound, path)
+        self._sound_request = (path, future)
+        return future
 
     def select_all_visible(self):
-        """ Selects all items currently visible in the treeview. """
+        """ Selects all items passing the current filters (adding any rows not yet shown to the treeview first). """
         self._update_status("Selecting all visible items...")
         try:
-            all_items = self.tree.get_children()
-            if all_items:
-                self.tree.selection_set(all_items)
+            if self._tree_row_limit < len(self.display_indices):
+                self._tree_row_limit = len(self.display_indices); self.populate_treeview()
+            all_items = self._current_iids
+            # Select in chunks so no single Tcl command carries every item id; skip if already all selected
+            if all_items and len(self._selected_iids) != len(all_items):
+                self.tree.selection_set(all_items[:SELECTION_CHUNK])
+                for start in range(SELECTION_CHUNK, len(all_items), SELECTION_CHUNK):
+                    self.tree.selection_add(all_items[start:start + SELECTION_CHUNK])
+                self._selected_iids = set(all_items)
             self.update_counts()
             self._update_status(f"Selected {len(all_items)} visible items.")
         except Exception as e:
              self._update_status("Error selecting all items.")
-             print(f"SELECT ALL ERROR: {e}\n{traceback.format_exc()}")
+             print(f"SELECT ALL ERROR: {e}{traceback_text()}")
+
+    def _ordered_selection(self):
+        """
+        The selected item ids in display order. A full selection is the item list itself; a small one
+        is sorted by a row-position index cached per item list; otherwise one set-membership scan.
+        """
+        selected = self._selected_iids; current = self._current_iids
+        if len(selected) == len(current): return list(current) # The selection only ever holds tree items
+        if len(selected) * 32 < len(current):
+            cached = self._iid_rows
+            if cached is None or cached[0] is not current:
+                cached = self._iid_rows = (current, {iid: row for row, iid in enumerate(current)})
+            rows = cached[1]
+            return sorted((iid for iid in selected if iid in rows), key=rows.__getitem__)
+        return [iid for iid in current if iid in selected]
+
+    def _ordered_selection_paths(self):
+        """ Full paths of the selected entries, in display order. """
+        entries = self.full_audio_data
+        return [entries[int(iid)].path for iid in self._ordered_selection()]
 
     def deselect_all(self):
         """ Deselects all items in the treeview. """
-        if self.tree.selection():
+        if self._selected_iids:
             self.tree.selection_set([])
+            self._selected_iids = set()
             self.update_counts()
             self._update_status("Selection cleared.")
 
@@ -930,135 +1989,169 @@ class AudioReviewApp(tk.Tk):
         item_id = selected_items[0]
         entry = self.get_entry_by_iid(item_id)
 
-        if not entry: self._update_status(f"Error finding data for selected item: {item_id}"); print(f"Error: Could not find data dictionary for tree item iid: {item_id}"); return
+        if not entry: self._update_status(f"Error finding data for selected item: {item_id}"); print(f"Error: Could not find data entry for tree item iid: {item_id}"); return
 
-        file_path = entry['path']; display_name = entry['filename']
+        file_path = entry.path; display_name = entry.filename
 
-        if not os.path.exists(file_path):
-            self._update_status(f"Error - File not found: {display_name}")
-            messagebox.showerror("File Not Found", f"The audio file could not be found at the expected path:\n{file_path}", parent=self)
-            return
+        # Decoding runs on the loader thread (usually already done by the selection preload, or cached)
+        self._play_request += 1; request = self._play_request
+        self._play_future = None # The previous play request is stale; its queued decode may be cancelled
+        future = self._play_future = self._load_sound(file_path) # Jumps ahead of a queued preload of another row
+        future.add_done_callback(lambda f: self._enqueue(self._play_loaded, (f, request, file_path, display_name)))
 
+    def _play_loaded(self, future, request, file_path, display_name):
+        """ Starts a decoded Sound once its load finished (main GUI thread); stale requests are dropped. """
+        if request != self._play_request or future.cancelled(): return
+        self._play_future = None
+        # Paths were checked at load; only stat the file again if loading it fails
         try:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
+            sound = future.result() # Re-raises a load error
+            pygame.mixer.stop()
+            sound.play() # Replays reuse the already decoded Sound
             self._update_status(f"Playing: {display_name}")
-        except pygame.error as e:
+        except (pygame.error, FileNotFoundError) as e:
+            if not os.path.exists(file_path):
+                self._update_status(f"Error - File not found: {display_name}")
+                messagebox.showerror("File Not Found", f"The audio file could not be found at the expected path:\n{file_path}", parent=self)
+                return
             self._update_status(f"Error playing {display_name}: {e}")
             messagebox.showerror("Playback Error", f"Could not play file:\n{file_path}\n\nPygame Error: {e}", parent=self)
             print(f"Error playing {file_path}: {e}")
         except Exception as e:
              self._update_status(f"Unexpected error playing {display_name}")
-             messagebox.showerror("Playback Error", f"An unexpected error occurred during playback attempt:\n{e}\n\n{traceback.format_exc()}", parent=self)
-             print(f"Unexpected error playing {file_path}: {e}\n{traceback.format_exc()}")
+             messagebox.showerror("Playback Error", f"An unexpected error occurred during playback attempt:\n{e}{traceback_text(2)}", parent=self)
+             print(f"Unexpected error playing {file_path}: {e}{traceback_text()}")
 
 
     def export_selected_audio(self):
         """ Exports selected files as a single concatenated audio file (WAV or MP3). Runs in background thread. """
-        selected_iids = self.tree.selection()
+        selected_iids = self._selected_iids # Mirrored set; no round-trip through tree.selection()
         if not selected_iids: messagebox.showinfo("No Selection", "Please select one or more audio files to export.", parent=self); return
 
         file_types = [("WAV files", "*.wav")]; default_ext = ".wav"
-        if FFMPEG_AVAILABLE: file_types.append(("MP3 files", "*.mp3"))
+        if find_ffmpeg(): file_types.append(("MP3 files", "*.mp3"))
         else: print("FFmpeg not detected, MP3 export option disabled.")
 
         output_path = filedialog.asksaveasfilename(title="Export Combined Audio As", defaultextension=default_ext, filetypes=file_types, parent=self)
         if not output_path: return
 
         output_format = Path(output_path).suffix[1:].lower()
-        if output_format == "mp3" and not FFMPEG_AVAILABLE: messagebox.showerror("Export Error", "Cannot export as MP3 because FFmpeg was not found or is not in the system PATH.", parent=self); return
+        if output_format == "mp3" and not find_ffmpeg(): messagebox.showerror("Export Error", "Cannot export as MP3 because FFmpeg was not found or is not in the system PATH.", parent=self); return
 
         self._update_status(f"Starting export of {len(selected_iids)} files as '{output_format}'...")
-        self.update_idletasks()
         print(f"Starting background export of {len(selected_iids)} files to {output_path} (format: {output_format})")
 
-        thread = threading.Thread(target=self._perform_audio_export, args=(list(selected_iids), output_path, output_format), daemon=True)
-        thread.start()
+        ordered_selection_paths = self._ordered_selection_paths() # Display order is read here on the GUI thread
+        self._export_thread = threading.Thread(target=self._perform_audio_export, args=(ordered_selection_paths, output_path, output_format), daemon=True)
+        self._export_thread.start()
 
-    def _perform_audio_export(self, selected_iids, output_path, output_format):
+    def _perform_audio_export(self, ordered_selection_paths, output_path, output_format):
         """ Actual audio export logic (concatenation and saving). Runs in background thread. """
-        combined_audio = None; exported_count = 0; error_files = []
-        start_time = time.time()
+        exported_count = 0; error_files = []
+        start_time = time.monotonic()
+        # Frames are streamed into the output one file at a time instead of growing an in-memory AudioSegment
+        writer = AudioConcatWriter(output_path, output_format)
 
-        ordered_selection_paths = [item for item in self.tree.get_children() if item in selected_iids]
         total_to_export = len(ordered_selection_paths)
         self._append_log(f"Preparing to export {total_to_export} selected files...")
 
-        for i, file_path in enumerate(ordered_selection_paths):
-            self._update_status(f"Exporting audio... Processing file {i+1}/{total_to_export}")
-            entry = self.get_entry_by_iid(file_path); filename = Path(file_path).name if not entry else entry['filename']
-            self._append_log(f"  [{i+1}/{total_to_export}] Adding: {filename}")
-
-            if not os.path.exists(file_path): self._append_log(f"    Error: File not found - {file_path}"); error_files.append(filename + " (Not Found)"); continue
+        # Files are read/decoded ahead on a thread pool (file I/O releases the GIL) while this thread
+        # writes them out in order; at most `prefetch` decoded files are held in memory at once, and
+        # files over EXPORT_PREFETCH_MAX_BYTES are only opened ahead and then streamed in blocks.
+        # Reads mostly wait on the disk, so use up to two threads per core (capped at 8) but never more than files
+        workers = max(1, min(8, (os.cpu_count() or 1) * 2, total_to_export)); prefetch = workers * 2
+        writer_closed = False
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = collections.deque()
+                next_submit = 0
+                submit = executor.submit; append_log = self._append_log; update_status = self._update_status # Hoisted out of the loop
+                last_tick = None # Status bar progress at most every 0.1s (plus the first and last file); the log still gets every file
+                for i, file_path in enumerate(ordered_selection_paths):
+                    while next_submit < total_to_export and len(pending) < prefetch:
+                        pending.append(submit(read_wav_frames, ordered_selection_paths[next_submit], EXPORT_PREFETCH_MAX_BYTES)); next_submit += 1
+                    future = pending.popleft()
+                    if self.stop_event.is_set():
+                        for f in pending: f.cancel()
+                        append_log("Stop requested. Export cancelled."); writer.abort(); return
+
+                    now = time.monotonic()
+                    if last_tick is None or now - last_tick >= 0.1 or i == total_to_export - 1:
+                        last_tick = now; update_status(f"Exporting audio... Processing file {i+1}/{total_to_export}")
+                    filename = os.path.basename(file_path)
+                    append_log("  [{}/{}] Adding: {}", i + 1, total_to_export, filename) # Formatted when rendered, not here
 
-            try:
-                audio_segment = AudioSegment.from_wav(file_path)
-                if combined_audio is None: combined_audio = audio_segment
-                else: combined_audio += audio_segment
-                exported_count += 1
-            except FileNotFoundError: self._append_log(f"    Error: File not found during pydub load - {filename}"); error_files.append(f"{filename} (Not Found)")
-            except Exception as e: self._append_log(f"    Error loading/processing {filename}: {type(e).__name__} - {e}"); error_files.append(f"{filename} ({type(e).__name__})")
-
-        if combined_audio is None:
-            self._update_status("Export failed - no valid audio files could be processed.")
-            self._append_log("Export cancelled: No valid audio segments were loaded.")
-            self.task_queue.put((messagebox.showerror, ("Export Failed", "No valid audio files could be processed for export.", {'parent': self})))
-            return
+                    try:
+                        params, frames = future.result()
+                    except FileNotFoundError: append_log(f"    Error: File not found - {file_path}"); error_files.append(f"{filename} (Not Found)"); continue
+                    except Exception as e: append_log(f"    Error loading/processing {filename}: {type(e).__name__} - {e}"); error_files.append(f"{filename} ({type(e).__name__})"); continue
+                    if frames is not None: writer.write(params, frames)
+                    else:
+                        try: writer.write_file(params, file_path) # Too large to read ahead
+                        except (OSError, wave.Error) as e: append_log(f"    Error streaming {filename}: {type(e).__name__} - {e}"); error_files.append(f"{filename} ({type(e).__name__})"); continue
+                    exported_count += 1
+
+            if exported_count == 0:
+                self._update_status("Export failed - no valid audio files could be processed.")
+                self._append_log("Export cancelled: No valid audio segments were loaded.")
+                self._call_soon(functools.partial(messagebox.showerror, "Export Failed", "No valid audio files could be processed for export.", parent=self))
+                return
 
-        try:
             self._append_log(f"Finalizing export... Saving combined audio to {output_path}")
             self._update_status(f"Saving combined audio to {Path(output_path).name}...")
-            combined_audio.export(output_path, format=output_format)
-            export_time = time.time() - start_time
+            writer.close(); writer_closed = True # The export is complete from here on; later errors must not abort it
+            export_time = time.monotonic() - start_time
             self._update_status(f"Successfully exported {exported_count} files to {Path(output_path).name} in {export_time:.2f}s.")
             self._append_log(f"Successfully exported {exported_count} combined files in {export_time:.2f}s.")
 
             final_message = f"Successfully exported {exported_count} combined audio files to:\n{output_path}"
             if error_files:
                  final_message += "\n\nThe following files encountered errors and were skipped:\n - " + "\n - ".join(error_files)
-                 self.task_queue.put((messagebox.showwarning, ("Export Complete with Errors", final_message, {'parent': self})))
+                 self._call_soon(functools.partial(messagebox.showwarning, "Export Complete with Errors", final_message, parent=self))
             else:
-                 self.task_queue.put((messagebox.showinfo, ("Export Complete", final_message, {'parent': self})))
+                 self._call_soon(functools.partial(messagebox.showinfo, "Export Complete", final_message, parent=self))
 
         except CouldntEncodeError as e:
-             err_msg = f"Could not encode the audio file (format: {output_format}).\nEnsure FFmpeg is installed correctly and accessible in your system's PATH for non-WAV export.\n\nPydub Error: {e}"
+             if not writer_closed: writer.abort()
+             err_msg = f"Could not encode the audio file (format: {output_format}).\nEnsure FFmpeg is installed correctly and accessible in your system's PATH for non-WAV export.\n\nEncoder Error: {e}"
              self._update_status("Export error (encoding). Check log.")
-             self._append_log(f"Export Encoding Error: {err_msg}\n{traceback.format_exc()}")
-             self.task_queue.put((messagebox.showerror, ("Export Error", err_msg, {'parent': self})))
+             self._append_log(f"Export Encoding Error: {err_msg}{traceback_text()}")
+             self._call_soon(functools.partial(messagebox.showerror, "Export Error", err_msg, parent=self))
         except Exception as e:
-             err_msg = f"An unexpected error occurred during the final export save step:\n{e}"
+             if not writer_closed: writer.abort()
+             err_msg = f"An unexpected error occurred while writing the export:\n{e}"
              self._update_status("Export error (saving). Check log.")
-             self._append_log(f"Unexpected Export Error: {err_msg}\n{traceback.format_exc()}")
-             self.task_queue.put((messagebox.showerror, ("Export Error", err_msg, {'parent': self})))
+             self._append_log(f"Unexpected Export Error: {err_msg}{traceback_text()}")
+             self._call_soon(functools.partial(messagebox.showerror, "Export Error", err_msg, parent=self))
 
     def export_selected_list(self):
         """ Exports the full paths of selected files to a text file (txt or jsonl). """
-        selected_iids = self.tree.selection()
+        selected_iids = self._selected_iids # Mirrored set; no round-trip through tree.selection()
         if not selected_iids: messagebox.showinfo("No Selection", "Please select one or more files to export their paths.", parent=self); return
 
         output_path = filedialog.asksaveasfilename(title="Export Selected File List As", defaultextension=".txt", filetypes=[("Text files", "*.txt"), ("JSONL files", "*.jsonl"), ("All files", "*.*")], parent=self)
         if not output_path: return
 
-        ordered_selection_paths = [item for item in self.tree.get_children() if item in selected_iids]
+        ordered_selection_paths = self._ordered_selection_paths()
         count_to_export = len(ordered_selection_paths)
 
         self._update_status(f"Exporting {count_to_export} file paths...")
         try:
-            count = 0
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if output_path.lower().endswith(".jsonl"):
-                     for file_path in ordered_selection_paths: f.write(json.dumps({"path": file_path}) + '\n'); count += 1
-                else:
-                     for file_path in ordered_selection_paths: f.write(file_path + '\n'); count += 1
+            # Whole list is built as one string and written with a single call
+            if output_path.lower().endswith(".jsonl"):
+                 data = b''.join([b'{"path":' + _json_dumps(file_path) + b'}\n' for file_path in ordered_selection_paths])
+            else:
+                 data = ''.join([file_path + '\n' for file_path in ordered_selection_paths]).encode('utf-8')
+            with open(output_path, 'wb') as f: f.write(data)
+            count = count_to_export
 
             self._update_status(f"Successfully exported {count} file paths to {Path(output_path).name}.")
             messagebox.showinfo("Export Complete", f"Successfully exported {count} file paths to:\n{output_path}", parent=self)
 
         except Exception as e:
              self._update_status("Error exporting file list.")
-             messagebox.showerror("Export Error", f"Could not write the file list:\n{e}\n\n{traceback.format_exc()}", parent=self)
-             print(f"Error exporting file list: {e}\n{traceback.format_exc()}")
+             messagebox.showerror("Export Error", f"Could not write the file list:\n{e}{traceback_text(2)}", parent=self)
+             print(f"Error exporting file list: {e}{traceback_text()}")
 
 
     def run_preprocessing_thread(self):
@@ -1077,8 +2170,11 @@ class AudioReviewApp(tk.Tk):
         main_frame = ttk.Frame(dialog, padding="15"); main_frame.pack(expand=True, fill="both")
         ttk.Label(main_frame, text="Audio-AES Command:").grid(row=0, column=0, padx=5, pady=5, sticky="w"); cmd_entry = ttk.Entry(main_frame, textvariable=self.audio_aes_command, width=40); cmd_entry.grid(row=0, column=1, columnspan=2, padx=5, pady=5, sticky="ew")
         ttk.Label(main_frame, text="Batch Size:").grid(row=1, column=0, padx=5, pady=5, sticky="w"); batch_entry = ttk.Entry(main_frame, textvariable=self.audio_aes_batch_size, width=10); batch_entry.grid(row=1, column=1, padx=5, pady=5, sticky="w")
-        overwrite_check = ttk.Checkbutton(main_frame, text="Overwrite existing scores.jsonl files", variable=self.preprocess_overwrite, onvalue=True, offvalue=False); overwrite_check.grid(row=2, column=0, columnspan=3, padx=5, pady=10, sticky="w")
-        button_frame = ttk.Frame(main_frame); button_frame.grid(row=3, column=0, columnspan=3, pady=(10,0))
+        ttk.Label(main_frame, text="Parallel Jobs:").grid(row=2, column=0, padx=5, pady=5, sticky="w"); jobs_spinbox = ttk.Spinbox(main_frame, from_=1, to=64, textvariable=self.audio_aes_parallel_jobs, width=8); jobs_spinbox.grid(row=2, column=1, padx=5, pady=5, sticky="w")
+        overwrite_check = ttk.Checkbutton(main_frame, text="Overwrite existing scores.jsonl files", variable=self.preprocess_overwrite, onvalue=True, offvalue=False); overwrite_check.grid(row=3, column=0, columnspan=3, padx=5, pady=(10,0), sticky="w")
+        combine_check = ttk.Checkbutton(main_frame, text="Share one audio-aes run per job across directories (loads the model once)", variable=self.preprocess_combine_dirs, onvalue=True, offvalue=False); combine_check.grid(row=4, column=0, columnspan=3, padx=5, pady=5, sticky="w")
+        rescan_check = ttk.Checkbutton(main_frame, text="Rescan all subdirectories (ignore the scan cache)", variable=self.preprocess_rescan, onvalue=True, offvalue=False); rescan_check.grid(row=5, column=0, columnspan=3, padx=5, pady=(5,10), sticky="w")
+        button_frame = ttk.Frame(main_frame); button_frame.grid(row=6, column=0, columnspan=3, pady=(10,0))
         result = {"ok_clicked": False}
         def on_ok():
             aes_cmd = self.audio_aes_command.get().strip()
@@ -1086,9 +2182,13 @@ class AudioReviewApp(tk.Tk):
             try:
                 bs = int(self.audio_aes_batch_size.get())
                 if bs < 1: raise ValueError("Batch size must be a positive integer.")
-                result["aes_cmd"] = aes_cmd; result["batch_size"] = bs; result["overwrite"] = self.preprocess_overwrite.get()
-                result["ok_clicked"] = True; dialog.destroy()
-            except ValueError as e: messagebox.showerror("Invalid Input", f"Please enter a valid positive integer for Batch Size.\nError: {e}", parent=dialog)
+            except (ValueError, tk.TclError) as e: messagebox.showerror("Invalid Input", f"Please enter a valid positive integer for Batch Size.\nError: {e}", parent=dialog); return
+            try:
+                jobs = int(self.audio_aes_parallel_jobs.get())
+                if jobs < 1: raise ValueError("Parallel jobs must be a positive integer.")
+            except (ValueError, tk.TclError) as e: messagebox.showerror("Invalid Input", f"Please enter a valid positive integer for Parallel Jobs.\nError: {e}", parent=dialog); return
+            result["aes_cmd"] = aes_cmd; result["batch_size"] = bs; result["parallel_jobs"] = jobs; result["overwrite"] = self.preprocess_overwrite.get(); result["combine_dirs"] = self.preprocess_combine_dirs.get(); result["rescan"] = self.preprocess_rescan.get()
+            result["ok_clicked"] = True; dialog.destroy()
         def on_cancel(): dialog.destroy()
         ok_button = ttk.Button(button_frame, text="Start Preprocessing", command=on_ok); ok_button.pack(side="left", padx=10)
         cancel_button = ttk.Button(button_frame, text="Cancel", command=on_cancel); cancel_button.pack(side="left", padx=10)
@@ -1097,38 +2197,40 @@ class AudioReviewApp(tk.Tk):
 
         if not result["ok_clicked"]: self._update_status("Preprocessing cancelled by user."); return
 
+        self._log_buffer.clear() # Lines not yet flushed belong to the log being cleared
         self.log_text.config(state=tk.NORMAL); self.log_text.delete('1.0', tk.END); self.log_text.config(state=tk.DISABLED)
         self._update_status("Starting preprocessing job...")
         self._append_log(f"--- Starting New Preprocessing Job ---")
         self._append_log(f"Base Directory: {base_dir}")
         self._append_log(f"Audio-AES Command: {result['aes_cmd']}")
         self._append_log(f"Batch Size: {result['batch_size']}")
+        self._append_log(f"Parallel Jobs: {result['parallel_jobs']}{' (directories share runs)' if result['combine_dirs'] else ''}")
         self._append_log(f"Overwrite Existing scores.jsonl: {result['overwrite']}")
         self._append_log("--------------------------------------")
 
         # <<< Create and start the thread, storing reference >>>
         self.stop_event.clear() # Ensure stop is cleared for the new job
         self.preprocessing_thread = threading.Thread(target=self._perform_preprocessing,
-                                                     args=(base_dir, result['aes_cmd'], result['batch_size'], result['overwrite']),
+                                                     args=(base_dir, result['aes_cmd'], result['batch_size'], result['overwrite'], result['parallel_jobs'], result['combine_dirs'], result['rescan']),
                                                      daemon=True)
         self.preprocessing_thread.start()
 
-    def _perform_preprocessing(self, base_dir, audio_aes_cmd, batch_size, overwrite_existing):
+    def _perform_preprocessing(self, base_dir, audio_aes_cmd, batch_size, overwrite_existing, parallel_jobs=1, combine_dirs=False, rescan_all=False):
         """ The actual preprocessing logic (runs in background thread). Checks stop_event. """
-        start_time = time.time()
-        processed_count = 0; error_count = 0; skipped_no_wav_count = 0; skipped_existing_count = 0
+        start_time = time.monotonic()
         subdirs_found = []
 
         # Reset stop event at the start of the task itself too (belt-and-suspenders)
         # self.stop_event.clear() # Already cleared before starting thread
 
         try:
-            subdirs_found = [d for d in os.listdir(base_dir) if os.path.isdir(os.path.join(base_dir, d))]
-            subdirs_found.sort()
+            # One scandir pass; DirEntry.is_dir() avoids a stat per entry on most platforms
+            with os.scandir(base_dir) as it:
+                subdirs_found = sorted(e.name for e in it if e.is_dir())
         except OSError as e:
             self._append_log(f"FATAL ERROR: Could not list directories in {base_dir}: {e}")
             self._update_status("Preprocessing failed: Could not list subdirectories.")
-            self.task_queue.put((messagebox.showerror, ("Preprocessing Error", f"Could not list subdirectories in {base_dir}:\n{e}", {'parent': self})))
+            self._call_soon(functools.partial(messagebox.showerror, "Preprocessing Error", f"Could not list subdirectories in {base_dir}:\n{e}", parent=self))
             self.preprocessing_thread = None # Clear thread ref on error
             return
 
@@ -1139,91 +2241,212 @@ class AudioReviewApp(tk.Tk):
             return
 
         total_dirs = len(subdirs_found)
+        # Outcome per subdirectory (by position in subdirs_found); counted once at the end and used to name failures
+        outcomes = np.full(total_dirs, OUTCOME_NOT_REACHED, dtype=np.int8)
         self._append_log(f"Found {total_dirs} subdirectories. Starting processing...")
 
-        # --- Loop through directories ---
-        for i, subdir_name in enumerate(subdirs_found):
-
-            # <<< Check stop event at start of loop iteration >>>
-            if self.stop_event.is_set():
-                self._append_log(f"Stop requested. Halting preprocessing before processing '{subdir_name}'.")
-                break
-
-            current_subdir_path = os.path.join(base_dir, subdir_name)
-            progress_prefix = f"({i+1}/{total_dirs}) {subdir_name}:"
-            self._update_status(f"{progress_prefix} Starting..."); self._append_log(f"\n--- {progress_prefix} ---")
-
-            paths_jsonl_path = os.path.join(current_subdir_path, PATHS_FILENAME)
-            scores_jsonl_path = os.path.join(current_subdir_path, SCORES_FILENAME)
-
-            # Check skip condition
-            if not overwrite_existing and os.path.exists(scores_jsonl_path):
-                self._append_log(f"  Skipping: {SCORES_FILENAME} already exists and overwrite is OFF.")
-                skipped_existing_count += 1
-                continue
-
-            # Check stop event again before file creation
-            if self.stop_event.is_set(): self._append_log(f"Stop requested detected before paths.jsonl creation for '{subdir_name}'. Halting."); break
+        # Directories unchanged since a previous run reuse their paths.jsonl instead of being listed again
+        # Kept in memory between runs of this session, so only the first run reads it from disk
+        memo_key = os.path.abspath(base_dir)
+        scan_cache_path = _scan_cache_path(base_dir) if LOAD_CACHE_DIR else None
+        scan_cache_dirty = False
+        if rescan_all:
+            scan_cache = {}; self._append_log("Rescanning all subdirectories (scan cache ignored).")
+        elif memo_key in self._scan_cache_memo:
+            scan_cache = self._scan_cache_memo[memo_key]
+        else:
+            scan_cache = _read_scan_cache(scan_cache_path) if scan_cache_path else {}
+        def remember_scan(subdir_path, wav_count):
+            """ Records the directory's state once this run is done changing it (audio-aes adds scores.jsonl). """
+            nonlocal scan_cache_dirty
+            signature = _scan_signature(subdir_path)
+            if signature is None: return
+            entry = signature + [wav_count]
+            if scan_cache.get(subdir_path) != entry: scan_cache[subdir_path] = entry; scan_cache_dirty = True
+
+        # --- Phase 1: check each directory and write its paths.jsonl ---
+        # Listing and writing are I/O-bound (slow on network storage) and release the GIL, so directories are
+        # prepared on a thread pool; results are consumed and logged in directory order.
+        def prepare(subdir_path, progress_prefix):
+            """
+            Returns (WAV count or -1, message, reused), or (None, reason, False) if the directory is skipped.
+            reused is True when the scan cache entry was still valid, so the directory doesn't need another stat.
+            """
+            if self.stop_event.is_set(): return None, "stopped", False
+            # Check skip condition; an empty or cut-off scores.jsonl (e.g. written by another tool) is regenerated
+            note = ""
+            if not overwrite_existing:
+                complete = scores_file_complete(os.path.join(subdir_path, SCORES_FILENAME))
+                if complete: return None, "existing", False
+                if complete is False: note = f"Existing {SCORES_FILENAME} is empty or incomplete; regenerating. "
 
             # --- Create paths.jsonl ---
             def progress_reporter(current, total, message):
                  if self.stop_event.is_set(): return # Avoid queueing updates if stopping
-                 self.task_queue.put((self._update_preprocess_status, (current, total, f"{progress_prefix} {message}")))
-            num_wavs, paths_msg = create_wav_jsonl(current_subdir_path, PATHS_FILENAME, progress_reporter)
-            self._append_log(f"  1. Create {PATHS_FILENAME}: {paths_msg}")
-
-            if num_wavs < 0:
-                 error_count += 1; self._append_log(f"  ERROR: Failed to create {PATHS_FILENAME}. Skipping audio-aes.")
-                 if self.stop_event.is_set(): self._append_log(f"Stop requested detected after paths.jsonl error for '{subdir_name}'. Halting."); break
-                 continue
-            elif num_wavs == 0:
-                 skipped_no_wav_count += 1; self._append_log(f"  Skipping audio-aes: No WAV files found.")
-                 if self.stop_event.is_set(): self._append_log(f"Stop requested detected after paths.jsonl check for '{subdir_name}'. Halting."); break
-                 continue
-
-            # Check stop event again before running the command
-            if self.stop_event.is_set(): self._append_log(f"Stop requested just before running audio-aes for '{subdir_name}'. Halting."); break
-
-            # --- Run audio-aes command ---
-            self._append_log(f"  2. Running {audio_aes_cmd}...")
-            self._update_status(f"{progress_prefix} Running audio-aes command...")
-            self.update_idletasks() # Try to force GUI update
-
-            run_start_time = time.time()
-            # This call BLOCKS until audio-aes finishes or errors
-            success, detailed_message = run_audio_aes(current_subdir_path, audio_aes_cmd, PATHS_FILENAME, SCORES_FILENAME, batch_size)
-            run_time = time.time() - run_start_time
-
-            # --- Log results (even if stop was requested during run) ---
-            status_suffix = ""
-            if self.stop_event.is_set():
-                status_suffix = " (Stop was requested during run)" # Add note if stop was pending
-                self._append_log(f"     Stop requested during audio-aes run for '{subdir_name}'. Processing loop will halt.")
-
-            self._append_log(f"     Command finished in {run_time:.2f}s. Result: {'Success' if success else 'FAILURE'}{status_suffix}")
-            if detailed_message: # Log the captured output from the command
-                for line in detailed_message.strip().splitlines():
-                    self._append_log(f"       {line}") # Indent command output
-            elif not success and not self.stop_event.is_set(): # Log only if failed and no detailed msg and not stopping
-                 self._append_log(f"       Command failed with no detailed output message.")
-
-            if success: processed_count += 1
-            else: error_count += 1 # Count errors even if stopping after this
-
-            # If stop was requested during the run, break loop now after logging
-            if self.stop_event.is_set(): break
-            # --- End of Loop Iteration ---
+                 self._enqueue(self._update_preprocess_status, (current, total, f"{progress_prefix} {message}"))
+            cached_scan = scan_cache.get(subdir_path)
+            if cached_scan is not None and cached_scan[:-1] == _scan_signature(subdir_path):
+                return cached_scan[-1], f"{note}Directory unchanged since the last run; reusing {PATHS_FILENAME} ({cached_scan[-1]} WAVs).", True
+            num_wavs, paths_msg = create_wav_jsonl(subdir_path, PATHS_FILENAME, progress_reporter)
+            return num_wavs, note + paths_msg, False
+
+        work = [] # (subdir name, subdir path, WAV count, log prefix, index) left for audio-aes
+        max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, total_dirs))
+        def prepared_dirs(executor):
+            """
+            Yields (index, name, path, log prefix, prepare() result) in directory order. Only a few directories per worker
+            are in flight, so paths, prefixes and futures aren't held for the whole tree at once.
+            """
+            def result(future):
+                # An unexpected failure in one directory is reported as its paths.jsonl error instead of ending the job
+                try: return future.result()
+                except Exception as e: return -1, f"Unexpected error preparing directory: {e}{traceback_text()}", False
+            pending = collections.deque()
+            for i, subdir_name in enumerate(subdirs_found):
+                subdir_path = os.path.join(base_dir, subdir_name); progress_prefix = f"({i+1}/{total_dirs}) {subdir_name}:"
+                pending.append((i, subdir_name, subdir_path, progress_prefix, executor.submit(prepare, subdir_path, progress_prefix)))
+                if len(pending) >= max_workers * 2:
+                    i, subdir_name, subdir_path, progress_prefix, future = pending.popleft()
+                    yield i, subdir_name, subdir_path, progress_prefix, result(future)
+            while pending:
+                i, subdir_name, subdir_path, progress_prefix, future = pending.popleft()
+                yield i, subdir_name, subdir_path, progress_prefix, result(future)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for i, subdir_name, current_subdir_path, progress_prefix, (num_wavs, paths_msg, reused) in prepared_dirs(executor):
+
+                # <<< Check stop event before handling each directory >>>
+                if self.stop_event.is_set() or paths_msg == "stopped":
+                    self._append_log(f"Stop requested. Halting preprocessing before processing '{subdir_name}'.")
+                    break
+
+                self._update_status(f"{progress_prefix} Checked."); self._append_log(f"\n--- {progress_prefix} ---")
+                if num_wavs is None:
+                    self._append_log(f"  Skipping: {SCORES_FILENAME} already exists and overwrite is OFF.")
+                    outcomes[i] = OUTCOME_SKIPPED_EXISTING
+                    continue
+                self._append_log(f"  1. Create {PATHS_FILENAME}: {paths_msg}")
+
+                if num_wavs < 0:
+                     outcomes[i] = OUTCOME_ERROR; self._append_log(f"  ERROR: Failed to create {PATHS_FILENAME}. Skipping audio-aes.")
+                     continue
+                elif num_wavs == 0:
+                     if not reused: remember_scan(current_subdir_path, 0) # A reused entry was just confirmed; skip the stats
+                     outcomes[i] = OUTCOME_SKIPPED_NO_WAV; self._append_log(f"  Skipping audio-aes: No WAV files found.")
+                     continue
+                work.append((subdir_name, current_subdir_path, num_wavs, progress_prefix, i))
+
+        # The command is looked up once for the whole job: each run then starts the resolved file without another
+        # PATH search, and a missing command is reported once here instead of failing every directory separately
+        resolved_cmd = shutil.which(audio_aes_cmd) if work else None
+        if work and resolved_cmd is None:
+            self._append_log(f"\nERROR: Command '{audio_aes_cmd}' not found or not executable. Make sure it's installed and in your system PATH. Skipping audio-aes for {len(work)} directories.")
+            for item in work: outcomes[item[4]] = OUTCOME_ERROR
+            work = []
+        elif work:
+            resolved_cmd = os.path.abspath(resolved_cmd) # Runs use another working directory
+            if resolved_cmd != audio_aes_cmd: self._append_log(f"Using {resolved_cmd}")
+
+        # --- Phase 2: run audio-aes on up to parallel_jobs directories at once ---
+        # Each run is an external process, so threads just wait on it; results are logged as runs finish
+        if work and not self.stop_event.is_set():
+            jobs = max(1, min(parallel_jobs, len(work)))
+            if combine_dirs and jobs < len(work):
+                # One run per job scores several directories, so the model is loaded once per job instead of once
+                # per directory. Directories go to the job with the fewest WAVs so far, largest first.
+                groups = [[] for _ in range(jobs)]; group_wavs = [0] * jobs
+                for item in sorted(work, key=lambda item: -item[2]):
+                    k = group_wavs.index(min(group_wavs)); groups[k].append(item); group_wavs[k] += item[2]
+                groups = [sorted(group, key=lambda item: item[4]) for group in groups] # Back to directory order
+                self._append_log(f"\nRunning {audio_aes_cmd} {jobs} time(s) for {len(work)} directories ({jobs} at a time)...")
+            else:
+                groups = [[item] for item in work]
+                self._append_log(f"\nRunning {audio_aes_cmd} on {len(work)} directories ({jobs} at a time)...")
+            # The combined files of shared runs are transient; paths.jsonl itself stays in each subdirectory (the loader reads it)
+            transient_dir = None
+            if len(groups) < len(work):
+                try: transient_dir = self._transient_dir = make_transient_dir()
+                except OSError as e: self._append_log(f"Could not create a temporary directory ({e}); using {base_dir} for the shared runs.")
+            run_dir = transient_dir or base_dir
+            def run_group(k, group):
+                if self.stop_event.is_set(): return [(item, False, "Not started: stop requested.") for item in group], 0.0
+                # Lines of concurrent runs interleave in the log, so name the directory (or job) when more than one runs
+                tag = "" if jobs == 1 else f"[{group[0][0]}] " if len(group) == 1 else f"[job {k+1}] "
+                log_line = lambda line: self._append_log("       {}{}", tag, line) # Formatted when rendered, not per stderr line here
+                run_start_time = time.monotonic()
+                if len(group) == 1:
+                    # Blocks this worker until audio-aes finishes, errors or is stopped; stderr is logged live
+                    success, detailed_message = run_audio_aes(group[0][1], resolved_cmd, PATHS_FILENAME, SCORES_FILENAME, batch_size,
+                                                              line_callback=log_line, stop_event=self.stop_event)
+                    return [(group[0], success, detailed_message)], time.monotonic() - run_start_time
+                # Paths files are concatenated in the temporary directory (the paths in them are absolute) and the
+                # scores are split back by line count: line i of the output scores line i of the input
+                combined_paths = f"_combined_{PATHS_FILENAME}.{k}"; combined_scores = f"_combined_{SCORES_FILENAME}.{k}"
+                try:
+                    line_counts = combine_paths_files([os.path.join(item[1], PATHS_FILENAME) for item in group], os.path.join(run_dir, combined_paths))
+                    success, detailed_message = run_audio_aes(run_dir, resolved_cmd, combined_paths, combined_scores, batch_size,
+                                                              line_callback=log_line, stop_event=self.stop_event)
+                    if success:
+                        success, split_message = split_scores_file(os.path.join(run_dir, combined_scores),
+                                                                   [os.path.join(item[1], SCORES_FILENAME) for item in group], line_counts)
+                        detailed_message = f"{detailed_message}\n{split_message}"
+                except OSError as e:
+                    success, detailed_message = False, f"Error combining or splitting files for the shared run: {e}"
+                finally:
+                    _discard_file(os.path.join(run_dir, combined_paths)); _discard_file(os.path.join(run_dir, combined_scores))
+                names = ", ".join(item[0] for item in group)
+                detailed_message = f"Shared run {k+1} ({len(group)} directories: {names}):\n{detailed_message}"
+                return [(item, success, detailed_message) for item in group], time.monotonic() - run_start_time
+            with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {executor.submit(run_group, k, group): group for k, group in enumerate(groups)}
+                finished = 0
+                self._update_status(f"Running audio-aes: 0/{len(work)} directories done...")
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        results, run_time = future.result()
+                    except Exception as e:
+                        results, run_time = [(item, False, f"Unexpected error running audio-aes: {e}") for item in futures[future]], 0.0
+                    for (subdir_name, subdir_path, num_wavs, progress_prefix, i), success, detailed_message in results:
+                        finished += 1
+                        remember_scan(subdir_path, num_wavs)
+
+                        # --- Log results (even if stop was requested during run) ---
+                        status_suffix = ""
+                        if self.stop_event.is_set():
+                            status_suffix = " (Stop was requested during run)" # Add note if stop was pending
+                        self._append_log(f"\n--- {progress_prefix} ---")
+                        self._append_log(f"  2. {audio_aes_cmd} finished in {run_time:.2f}s. Result: {'Success' if success else 'FAILURE'}{status_suffix}")
+                        if detailed_message: # Log the captured output from the command
+                            for line in detailed_message.strip().splitlines():
+                                self._append_log(f"       {line}") # Indent command output
+                        elif not success and not self.stop_event.is_set(): # Log only if failed and no detailed msg and not stopping
+                             self._append_log(f"       Command failed with no detailed output message.")
+
+                        outcomes[i] = OUTCOME_OK if success else OUTCOME_ERROR # Errors count even if stopping after this
+                    self._update_status(f"Running audio-aes: {finished}/{len(work)} directories done ({subdir_name}: {'ok' if success else 'failed'}).")
+                    if self.stop_event.is_set():
+                        for f in futures: f.cancel() # Runs not started yet are dropped; running ones are stopped by run_audio_aes
+            if transient_dir: shutil.rmtree(transient_dir, ignore_errors=True); self._transient_dir = None
+        elif work:
+            self._append_log(f"Stop requested. Halting preprocessing before running {audio_aes_cmd}.")
+
+        self._scan_cache_memo[memo_key] = scan_cache
+        if scan_cache_dirty and scan_cache_path: _write_scan_cache(scan_cache_path, scan_cache)
 
         # --- Final Summary ---
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         job_status = 'Completed normally' if not self.stop_event.is_set() else 'Halted by user request'
+        processed_count, error_count, skipped_no_wav_count, skipped_existing_count = np.bincount(outcomes[outcomes >= 0], minlength=4).tolist()
         summary_lines = [
             f"\n--- Preprocessing Job Summary ({job_status}) ---",
             f"Total Time: {total_time:.2f} seconds", f"Base Directory: {base_dir}",
             f"Subdirectories Scanned: {total_dirs}", f"Successfully Processed (audio-aes): {processed_count}",
             f"Errors Encountered: {error_count}", f"Skipped (No WAV files): {skipped_no_wav_count}",
-            f"Skipped (scores.jsonl existed, overwrite OFF): {skipped_existing_count}",
-            "--------------------------------------------------" ]
+            f"Skipped (scores.jsonl existed, overwrite OFF): {skipped_existing_count}" ]
+        if error_count:
+            failed = np.flatnonzero(outcomes == OUTCOME_ERROR)
+            names = ", ".join(subdirs_found[j] for j in failed[:FAILED_DIRS_SHOWN])
+            summary_lines.append(f"Failed: {names}" + (f" (+{len(failed) - FAILED_DIRS_SHOWN} more, see log)" if len(failed) > FAILED_DIRS_SHOWN else ""))
+        summary_lines.append("--------------------------------------------------")
         summary_msg = "\n".join(summary_lines)
         flat_summary = summary_msg.replace('\n', ' | ')
 
@@ -1231,7 +2454,7 @@ class AudioReviewApp(tk.Tk):
         for line in summary_lines: self._append_log(line)
 
         # Notify user (show even if halted)
-        self.task_queue.put((messagebox.showinfo, (f"Preprocessing {job_status}", f"{summary_msg}\n\nPlease reload the data if needed.", {'parent': self})))
+        self._call_soon(functools.partial(messagebox.showinfo, f"Preprocessing {job_status}", f"{summary_msg}\n\nPlease reload the data if needed.", parent=self))
 
         # <<< Clear the thread reference now that the job is done or stopped >>>
         self.preprocessing_thread = None
@@ -1240,20 +2463,37 @@ class AudioReviewApp(tk.Tk):
     def _on_closing(self):
         """ Handles window closing event. Sets stop event and destroys window. """
         print("Close button clicked. Requesting stop for background tasks...")
+        self._closing = True # Before stop_event, so threads reacting to it already skip their GUI updates
         self.stop_event.set() # <<< Signal the background thread to stop >>>
 
         # Give the background thread a moment to potentially react if not blocked
         # It won't help if blocked on subprocess.run, but doesn't hurt.
         # self.after(100, self._destroy_after_stop_check) # Alternative: delay destroy slightly
 
+        if self._sound_loader: self._sound_loader.shutdown(wait=False)
         if self.playback_enabled and pygame.mixer.get_init():
-            try: pygame.mixer.music.stop(); pygame.mixer.quit(); print("Pygame mixer quit successfully.")
+            try:
+                pygame.mixer.stop() # Silence at once
+                if not FAST_EXIT: _get_sound.cache_clear(); pygame.mixer.quit(); print("Pygame mixer quit successfully.")
+                # With FAST_EXIT the process ends right after the main loop; the OS releases the audio device
             except Exception as e: print(f"Error quitting pygame mixer: {e}")
 
         print("Destroying main window...")
         self.destroy()
         print("Application closed signal sent.")
 
+    def wait_for_background_jobs(self):
+        """
+        Waits for a running preprocessing or export job after stop_event was set (call once the main loop ended).
+        run_audio_aes then terminates and reaps its audio-aes process and the job's thread pools finish,
+        so exiting with os._exit afterwards leaves no orphaned child or half-written file behind.
+        """
+        for thread in (self.preprocessing_thread, self._export_thread):
+            if thread is not None and thread.is_alive():
+                print(f"Waiting for background job '{thread.name}' to stop...")
+                thread.join()
+        if self._transient_dir: shutil.rmtree(self._transient_dir, ignore_errors=True) # In case the job ended before cleaning up
+
     # Optional helper if delaying destroy:
     # def _destroy_after_stop_check(self):
     #     if self.preprocessing_thread and self.preprocessing_thread.is_alive():
@@ -1274,7 +2514,7 @@ if __name__ == "__main__":
     app = AudioReviewApp()
     print("DEBUG: AudioReviewApp instance created.")
 
-    if not FFMPEG_AVAILABLE:
+    if not find_ffmpeg():
          print("\nWARNING: FFmpeg executable was not found in the system's PATH.")
          print("         MP3 export functionality will be disabled.")
 
@@ -1298,4 +2538,10 @@ if __name__ == "__main__":
              app.stop_event.set()
         # Give daemon threads a very brief moment if needed
         # time.sleep(0.2)
-        print("Exiting script.")
\ No newline at end of file
+        print("Exiting script.")
+    if FAST_EXIT:
+        # Only reached after a normal close (errors still propagate with their traceback). Running jobs were told
+        # to stop and are waited for first, as the interpreter would (their thread pools aren't daemons).
+        app.wait_for_background_jobs()
+        sys.stdout.flush(); sys.stderr.flush()
+        os._exit(0)
\ No newline at end of file